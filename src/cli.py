@@ -4,19 +4,10 @@ SimTool CLI interface with ModelSim-style commands.
 
 import click
 import sys
-import os
 from pathlib import Path
 
-from .core.project import Project
-from .core.logging import get_logger, setup_logging
-from .core.plugin_system import get_plugin_registry
-from .core.constants import DefaultPaths, DefaultConfig, ProjectStructureMessages, TestbenchTypes
-from .core.exceptions import (
-    ProjectConfigError, SimulatorNotFoundError, CompilationFailedError, 
-    SimulationFailedError, format_exception_with_context
-)
-from .toolchain.base import SimulatorError, CompilationError, SimulationError
-from .ui.colors import success, error, progress, info, warning, header
+from .core.logging import setup_logging
+from .core.constants import DefaultConfig, TestbenchTypes
 
 
 @click.group()
@@ -52,7 +43,8 @@ def init(ctx, simulator, force):
 
 @main.command()
 @click.argument('files', nargs=-1, type=click.Path(exists=True))
-@click.option('--top', required=True, help='Top-level module name')
+@click.option('--top', required=True, multiple=True,
+              help='Top-level module name (repeat to build several tops in parallel, each in <build_dir>/<top>)')
 @click.option('--simulator', help='Override default simulator')
 @click.option('--tb-type', default=TestbenchTypes.AUTO, type=click.Choice(TestbenchTypes.ALL_TYPES), help='Testbench type')
 @click.option('--waves/--no-waves', default=None, help='Enable/disable VCD waveform generation')
@@ -62,10 +54,12 @@ def vlog(ctx, files, top, simulator, tb_type, waves):
     from .cli_commands.commands import CompileHandler
     
     verbose = ctx.obj['verbose']
-    file_paths = [Path(f) for f in files] if files else []
     
     handler = CompileHandler()
-    success = handler.compile_rtl(file_paths, top, simulator, tb_type, waves, verbose)
+    if len(top) == 1:
+        success = handler.compile_rtl(files, top[0], simulator, tb_type, waves, verbose)
+    else:
+        success = all(handler.compile_many([(files, t) for t in top], simulator, tb_type, waves, verbose))
     if not success:
         sys.exit(1)
 
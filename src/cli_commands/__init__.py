@@ -2,12 +2,15 @@
 SimTool CLI command handlers package.
 """
 
-from .commands import (
-    ProjectInitializer, CompileHandler, SimulationHandler,
-    CleanupHandler, DoctorHandler
-)
-
 __all__ = [
     'ProjectInitializer', 'CompileHandler', 'SimulationHandler',
     'CleanupHandler', 'DoctorHandler'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Import handlers on first use so loading the package stays cheap
+    if name in __all__:
+        from . import commands
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
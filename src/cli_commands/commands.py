@@ -2,15 +2,18 @@
 CLI command handlers with separated concerns.
 """
 
-import subprocess
-import shutil
+import hashlib
+import json
+import logging
+import mmap
+import os
 import re
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple, Union
 
 from ..core.project import Project
 from ..core.logging import get_logger
-from ..core.plugin_system import get_plugin_registry
 from ..core.constants import DefaultPaths, DefaultConfig, ProjectStructureMessages
 from ..core.exceptions import (
     ProjectConfigError, SimulatorNotFoundError, CompilationFailedError,
@@ -20,6 +23,133 @@ from ..toolchain.base import SimulatorError, CompilationError, SimulationError
 from ..ui.colors import success, error, progress, info, warning, header
 
 
+# simtool.cfg contents; only the default simulator varies between projects
+_CONFIG_TEMPLATE = f"""default_simulator: %s
+default_waves: {str(DefaultConfig.WAVES_ENABLED).lower()}
+rtl_paths: 
+  - {DefaultPaths.RTL_DIR}
+tb_paths:
+  - {DefaultPaths.TESTBENCH_DIR}
+build_dir: {DefaultPaths.BUILD_DIR}
+include_paths: []
+defines: {{}}
+systemc_path: null
+gtkwave_path: null
+verilator_path: null""".encode()
+
+
+# Directories created by 'simtool init'
+_DEFAULT_DIRS = (
+    DefaultPaths.RTL_DIR,
+    DefaultPaths.TESTBENCH_DIR,
+    DefaultPaths.BUILD_DIR,
+    DefaultPaths.SCRIPTS_DIR,
+)
+
+# Regular expression to match number and optional unit (e.g. 1000ns, 10us)
+_TIME_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)\s*([a-zA-Z]*)$')
+
+# Accepted time units and their normalized form
+_TIME_UNITS = {
+    '': 'ns',      # Default to nanoseconds if no unit specified
+    'ps': 'ps',    # picoseconds
+    'ns': 'ns',    # nanoseconds
+    'us': 'us',    # microseconds
+    'ms': 'ms',    # milliseconds
+    's': 's',      # seconds
+}
+_TIME_UNITS_HELP = str(list(_TIME_UNITS))
+
+# Source file category for each supported suffix (lowercase)
+_SUFFIX_CATEGORY = {
+    '.sv': 'hdl',
+    '.v': 'hdl',
+    '.vhd': 'hdl',
+    '.py': 'py',
+    '.cpp': 'cpp',
+    '.c': 'cpp',
+}
+
+# Below this many user-specified files, classification runs inline; a thread pool
+# costs more to start than the few reads it would overlap
+_CLASSIFY_POOL_MIN_FILES = 4
+
+# Header suffixes picked up from source directories when hashing build inputs
+# (`include targets that are not listed as sources themselves)
+_HEADER_SUFFIXES = ('.svh', '.vh', '.h', '.hpp')
+
+# Makefile contents that show a Verilator build was made with tracing
+_MAKEFILE_TRACE_MARKERS = (b'--trace', b'verilated_vcd')
+
+
+@lru_cache(maxsize=None)
+def _which_cached(tool: str, search_path: str) -> Optional[str]:
+    """Look up a tool on the given search path (memoized)."""
+    import shutil
+    return shutil.which(tool, path=search_path)
+
+
+def _which(tool: str) -> Optional[str]:
+    """Look up a tool on PATH, re-probing only if PATH itself changed."""
+    return _which_cached(tool, os.environ.get('PATH', os.defpath))
+
+
+@lru_cache(maxsize=None)
+def _probe_verilator_version(verilator_path: str) -> str:
+    """Return the first line of `verilator --version`, raising if the probe fails (memoized on success)."""
+    import subprocess
+    # Skip locale decoding and the fd-closing loop; the version line is plain ASCII
+    result = subprocess.run([verilator_path, '--version'],
+                            capture_output=True, close_fds=False, timeout=5)
+    if result.returncode != 0:
+        raise RuntimeError(f"{verilator_path} --version exited with {result.returncode}")
+    return result.stdout.strip().split(b'\n', 1)[0].decode('ascii', 'replace')
+
+
+def _verilator_version(verilator_path: str) -> Optional[str]:
+    """Return the Verilator version line, or None if it cannot be determined right now."""
+    # lru_cache does not store exceptions, so a timeout or failure is retried next time
+    try:
+        return _probe_verilator_version(verilator_path)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _get_project_cached(cwd: str, cfg_mtime_ns: int, cfg_size: int) -> Project:
+    """Load the project for a directory and config file revision (memoized)."""
+    return Project()
+
+
+def _get_project() -> Project:
+    """Load the current project, reusing it while simtool.cfg is unchanged."""
+    try:
+        cfg_stat = os.stat(DefaultPaths.CONFIG_FILE)
+    except FileNotFoundError:
+        # Let Project raise its usual "config not found" error
+        return Project()
+    return _get_project_cached(os.getcwd(), cfg_stat.st_mtime_ns, cfg_stat.st_size)
+
+
+def _per_top_build_dirs(project: Project) -> List[Path]:
+    """List the <build_dir>/<top> directories written by compile_many (marked by their manifest)."""
+    try:
+        with os.scandir(project.build_dir) as entries:
+            return sorted(Path(entry.path) for entry in entries
+                          if entry.is_dir(follow_symlinks=False)
+                          and os.path.exists(os.path.join(entry.path, DefaultPaths.BUILD_MANIFEST)))
+    except OSError:
+        return []
+
+
+def _project_for_top(project: Project, top_module: str) -> Project:
+    """Point the project at <build_dir>/<top> when compile_many built that top there."""
+    top_dir = project.build_dir / top_module
+    if (top_dir / DefaultPaths.BUILD_MANIFEST).exists():
+        return project.with_overrides(build_dir=str(top_dir))
+    return project
+
+
 class ProjectInitializer:
     """Handles project initialization."""
     
@@ -30,20 +160,16 @@ class ProjectInitializer:
         """Initialize a new SimTool project."""
         try:
             # Create directory structure
-            directories = [
-                DefaultPaths.RTL_DIR,
-                DefaultPaths.TESTBENCH_DIR,
-                DefaultPaths.BUILD_DIR,
-                DefaultPaths.SCRIPTS_DIR
-            ]
-            
-            for dir_name in directories:
+            # (let mkdir report existing directories instead of probing each one first)
+            for dir_name in _DEFAULT_DIRS:
                 dir_path = Path(dir_name)
-                if dir_path.exists() and not force:
-                    pass  # Directory already exists
-                else:
-                    dir_path.mkdir(parents=True, exist_ok=True)
-                    self.logger.success(f"Created directory: {dir_path}")
+                try:
+                    dir_path.mkdir(parents=True)
+                except FileExistsError:
+                    if not dir_path.is_dir():
+                        raise
+                    continue  # Directory already exists
+                self.logger.success(f"Created directory: {dir_path}")
             
             # Create configuration file
             self._create_config_file(simulator, force)
@@ -65,30 +191,19 @@ class ProjectInitializer:
         if config_file.exists() and not force:
             return  # Config file already exists
         
-        config_content = f"""default_simulator: {simulator}
-default_waves: {str(DefaultConfig.WAVES_ENABLED).lower()}
-rtl_paths: 
-  - {DefaultPaths.RTL_DIR}
-tb_paths:
-  - {DefaultPaths.TESTBENCH_DIR}
-build_dir: {DefaultPaths.BUILD_DIR}
-include_paths: []
-defines: {{}}
-systemc_path: null
-gtkwave_path: null
-verilator_path: null"""
-        
-        with open(config_file, 'w') as f:
-            f.write(config_content)
+        config_file.write_bytes(_CONFIG_TEMPLATE % simulator.encode())
         self.logger.success(f"Created config file: {config_file}")
     
     def _show_project_structure(self):
         """Display the created project structure."""
         self.logger.header("Project structure:")
-        self.logger.info(f"  {DefaultPaths.RTL_DIR}/       - {ProjectStructureMessages.RTL_DESC}", no_symbol=True)
-        self.logger.info(f"  tb/        - {ProjectStructureMessages.TB_DESC}", no_symbol=True)
-        self.logger.info(f"  {DefaultPaths.BUILD_DIR}/      - {ProjectStructureMessages.WORK_DESC}", no_symbol=True)
-        self.logger.info(f"  {DefaultPaths.SCRIPTS_DIR}/   - {ProjectStructureMessages.SCRIPTS_DESC}", no_symbol=True)
+        # Emit the listing as one record so it costs a single write/flush
+        self.logger.info("\n".join([
+            f"  {DefaultPaths.RTL_DIR}/       - {ProjectStructureMessages.RTL_DESC}",
+            f"  tb/        - {ProjectStructureMessages.TB_DESC}",
+            f"  {DefaultPaths.BUILD_DIR}/      - {ProjectStructureMessages.WORK_DESC}",
+            f"  {DefaultPaths.SCRIPTS_DIR}/   - {ProjectStructureMessages.SCRIPTS_DESC}",
+        ]), no_symbol=True)
 
 
 class CompileHandler:
@@ -97,32 +212,34 @@ class CompileHandler:
     def __init__(self):
         self.logger = get_logger()
     
-    def compile_rtl(self, files: List[Path], top_module: str, simulator: Optional[str] = None,
-                   tb_type: str = 'auto', waves: Optional[bool] = None, verbose: bool = False) -> bool:
+    def compile_rtl(self, files: Sequence[Union[str, os.PathLike]], top_module: str, simulator: Optional[str] = None,
+                   tb_type: str = 'auto', waves: Optional[bool] = None, verbose: bool = False,
+                   build_subdir: Optional[str] = None) -> bool:
         """Compile RTL files with the specified simulator."""
         try:
             # Load project configuration
-            project = Project()
+            project = _get_project()
+            
+            if build_subdir:
+                # Build into <build_dir>/<build_subdir> without touching the cached project
+                project = project.with_overrides(build_dir=str(project.build_dir / build_subdir))
             
             # Get source files
             if files:
-                # User specified files - separate RTL from testbench files
-                rtl_files = []
-                tb_files = []
+                # User specified files - separate RTL from testbench files.
+                # Classification reads file contents, so overlap that I/O across threads.
+                # Paths handed in by callers are reused; only plain strings (e.g. CLI args) get wrapped
+                file_paths = [f if isinstance(f, Path) else Path(f) for f in files]
+                classify = partial(self._classify_user_file, project)
+                if len(file_paths) < _CLASSIFY_POOL_MIN_FILES:
+                    kinds = list(map(classify, file_paths))
+                else:
+                    from concurrent.futures import ThreadPoolExecutor
+                    with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+                        kinds = list(executor.map(classify, file_paths))
                 
-                for file in files:
-                    if file.suffix.lower() in ['.sv', '.v', '.vhd']:
-                        # Check if this looks like a testbench based on content or name
-                        if project._is_sv_testbench(file) or 'tb' in file.stem or 'test' in file.stem:
-                            tb_files.append(file)
-                        else:
-                            rtl_files.append(file)
-                    elif file.suffix.lower() == '.py':
-                        if project._is_cocotb_testbench(file):
-                            tb_files.append(file)
-                    elif file.suffix.lower() in ['.cpp', '.c']:
-                        if project._is_cpp_testbench(file):
-                            tb_files.append(file)
+                rtl_files = [f for f, kind in zip(file_paths, kinds) if kind == 'rtl']
+                tb_files = [f for f, kind in zip(file_paths, kinds) if kind == 'tb']
                 
                 detected_tb_type = project.detect_testbench_type(tb_files) if tb_files else 'none'
                 
@@ -137,30 +254,46 @@ class CompileHandler:
                     return False
                 
                 # Get testbench files only when auto-discovering
-                tb_files = project.get_tb_files(tb_type)
-                detected_tb_type = project.detect_testbench_type(tb_files)
+                tb_files, detected_tb_type = project.find_testbenches(tb_type)
             
-            if verbose:
+            # Skip building the file listings when INFO output is suppressed (e.g. --quiet)
+            if verbose and self.logger.is_enabled_for(logging.INFO):
                 self.logger.info(f"RTL files: {[str(f) for f in rtl_files]}")
                 self.logger.info(f"Testbench files: {[str(f) for f in tb_files]}")
-                self.logger.info(f"Detected testbench type: {detected_tb_type}")
+                self.logger.info("Detected testbench type: %s", detected_tb_type)
             
-            # Create simulator adapter
             sim_name = simulator or project.default_simulator
-            sim = self._create_simulator(sim_name, project)
             
             # Determine waves setting
             enable_waves = waves if waves is not None else project.default_waves
             
+            testbench = tb_files[0] if tb_files else None
+            
+            # Skip the simulator entirely when nothing changed since the last build
+            manifest_file = project.build_dir / DefaultPaths.BUILD_MANIFEST
+            build_key = self._compute_build_key(rtl_files, tb_files, top_module, sim_name,
+                                                enable_waves, project.config, detected_tb_type)
+            if build_key is not None and self._read_build_key(manifest_file) == build_key:
+                if not build_subdir:
+                    self._retire_top_build(project, top_module)
+                self.logger.success(f"Up to date: {top_module} (no sources or settings changed)")
+                return True
+            
+            # Create simulator adapter (only needed once a build is actually required)
+            sim = self._create_simulator(sim_name, project)
+            
             # Compile
             self.logger.info(f"Compiling with {sim_name}...")
             if enable_waves:
                 self.logger.info("Transparent VCD waveform generation enabled")
             
-            testbench = tb_files[0] if tb_files else None
             success = sim.compile(rtl_files, top_module, testbench=testbench, waves=enable_waves)
             
             if success:
+                if build_key is not None:
+                    self._write_build_key(manifest_file, build_key)
+                if not build_subdir:
+                    self._retire_top_build(project, top_module)
                 self.logger.success("Compilation successful")
             else:
                 self.logger.error("Compilation failed")
@@ -194,8 +327,41 @@ class CompileHandler:
             self.logger.error(exc.get_detailed_message())
             return False
     
+    def compile_many(self, modules: Sequence[Tuple[Sequence[Union[str, os.PathLike]], str]],
+                     simulator: Optional[str] = None, tb_type: str = 'auto',
+                     waves: Optional[bool] = None, verbose: bool = False) -> List[bool]:
+        """Compile several top modules in parallel worker processes.
+        
+        Each top is built in its own <build_dir>/<top_module> subdirectory so
+        concurrent builds never share generated files; simulation and cleanup
+        find those directories again by top module name.
+        """
+        # Plain strings keep the task payload picklable
+        tasks = [([str(f) for f in files], top_module, simulator, tb_type, waves, verbose)
+                 for files, top_module in modules]
+        if len(tasks) <= 1:
+            return [_compile_one(task) for task in tasks]
+        
+        # Imported lazily: the process pool pulls in multiprocessing and subprocess
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+            return list(executor.map(_compile_one, tasks))
+    
+    def _retire_top_build(self, project: Project, top_module: str):
+        """Unmark an older compile_many build of a top once the main build directory holds it."""
+        # Without its manifest, sim and clean no longer treat <build_dir>/<top> as current
+        manifest_file = project.build_dir / top_module / DefaultPaths.BUILD_MANIFEST
+        try:
+            manifest_file.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.debug(f"Could not remove build manifest {manifest_file}: {e}")
+    
     def _create_simulator(self, sim_name: str, project: Project):
         """Create simulator adapter using plugin system."""
+        # Imported lazily: plugin discovery is only needed once a simulator is used
+        from ..core.plugin_system import get_plugin_registry
         try:
             registry = get_plugin_registry()
             return registry.create_simulator(sim_name, project.config)
@@ -206,6 +372,116 @@ class CompileHandler:
                 available_simulators=available,
                 context={'requested_from': 'compile_handler'}
             )
+    
+    def _classify_user_file(self, project: Project, file: Path) -> Optional[str]:
+        """Classify a user-specified file as 'rtl', 'tb', or None if it is ignored."""
+        category = _SUFFIX_CATEGORY.get(file.suffix.lower())
+        if category == 'hdl':
+            # Check if this looks like a testbench based on content or name
+            if project._is_sv_testbench(file) or 'tb' in file.stem or 'test' in file.stem:
+                return 'tb'
+            return 'rtl'
+        elif category == 'py':
+            if project._is_cocotb_testbench(file):
+                return 'tb'
+        elif category == 'cpp':
+            if project._is_cpp_testbench(file):
+                return 'tb'
+        return None
+    
+    def _compute_build_key(self, rtl_files: List[Path], tb_files: Optional[Sequence[Path]], top_module: str,
+                           sim_name: str, waves: bool, config: Dict[str, Any],
+                           tb_type: str = 'none') -> Optional[str]:
+        """Hash the compile inputs (sources, headers, their mtime/size, tool and build settings)."""
+        # The classified/discovered lists already hold Path objects, so stat them as they are
+        sources = [*rtl_files, *(tb_files or ())]
+        stamps = []
+        try:
+            for source in sources:
+                st = os.stat(source)
+                stamps.append((str(source), st.st_mtime_ns, st.st_size))
+        except OSError:
+            return None  # Let the simulator report missing sources
+        
+        payload = {
+            'simulator': sim_name,
+            'tool': self._tool_identity(sim_name, config),
+            'top_module': top_module,
+            'tb_type': tb_type,
+            'waves': waves,
+            'include_paths': config.get('include_paths', []),
+            'defines': config.get('defines', {}),
+            'sources': stamps,
+            'headers': self._dependency_stamps(sources, config.get('include_paths') or []),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    
+    def _tool_identity(self, sim_name: str, config: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """Return the simulator binary in use and, for Verilator, its version line."""
+        tool_path = config.get(f'{sim_name}_path') or _which(sim_name)
+        version = _verilator_version(tool_path) if tool_path and sim_name == 'verilator' else None
+        return tool_path, version
+    
+    def _dependency_stamps(self, sources: List[Path], include_paths: List[str]) -> List[Tuple[str, int, int]]:
+        """Stamp files a compile may include: everything under include paths plus headers next to sources."""
+        stamps = []
+        # Include directories are walked in full; they hold headers and packages by definition
+        for include_dir in include_paths:
+            for dirpath, dirnames, filenames in os.walk(include_dir):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    self._append_stamp(stamps, os.path.join(dirpath, name))
+        # Source directories only contribute header files, not unrelated outputs written there
+        for source_dir in sorted({os.path.dirname(os.fspath(source)) or '.' for source in sources}):
+            try:
+                with os.scandir(source_dir) as entries:
+                    names = sorted(entry.name for entry in entries
+                                   if entry.name.endswith(_HEADER_SUFFIXES) and entry.is_file())
+            except OSError:
+                continue
+            for name in names:
+                self._append_stamp(stamps, os.path.join(source_dir, name))
+        return stamps
+    
+    @staticmethod
+    def _append_stamp(stamps: List[Tuple[str, int, int]], path: str) -> None:
+        """Append (path, mtime_ns, size) for a file, skipping files that vanished."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        stamps.append((path, st.st_mtime_ns, st.st_size))
+    
+    def _read_build_key(self, manifest_file: Path) -> Optional[str]:
+        """Read the build key recorded by the last successful compile, if its outputs still exist."""
+        try:
+            manifest = json.loads(manifest_file.read_text())
+            outputs = manifest.get('outputs', [])
+            build_key = manifest.get('build_key')
+        except (OSError, ValueError, AttributeError):
+            return None
+        # Deleted build products invalidate the record even though the manifest survived
+        build_dir = manifest_file.parent
+        if not all(os.path.lexists(build_dir / name) for name in outputs):
+            return None
+        return build_key
+    
+    def _write_build_key(self, manifest_file: Path, build_key: str):
+        """Record the build key of a successful compile and the outputs it left behind."""
+        try:
+            with os.scandir(manifest_file.parent) as entries:
+                outputs = sorted(entry.name for entry in entries if entry.name != manifest_file.name)
+            manifest_file.write_text(json.dumps({'build_key': build_key, 'outputs': outputs}))
+        except OSError as e:
+            self.logger.debug(f"Could not write build manifest {manifest_file}: {e}")
+
+
+def _compile_one(task: Tuple[List[str], str, Optional[str], str, Optional[bool], bool]) -> bool:
+    """Compile a single top module (worker entry point for compile_many)."""
+    files, top_module, simulator, tb_type, waves, verbose = task
+    return CompileHandler().compile_rtl(files, top_module, simulator=simulator, tb_type=tb_type,
+                                        waves=waves, verbose=verbose, build_subdir=top_module)
 
 
 class SimulationHandler:
@@ -219,8 +495,8 @@ class SimulationHandler:
                       verbose: bool = False) -> bool:
         """Run simulation of the specified module."""
         try:
-            # Load project configuration
-            project = Project()
+            # Load project configuration (using the per-top build of compile_many if there is one)
+            project = _project_for_top(_get_project(), module)
             
             # Create simulator adapter
             sim_name = simulator or project.default_simulator
@@ -276,6 +552,8 @@ class SimulationHandler:
     
     def _create_simulator(self, sim_name: str, project: Project):
         """Create simulator adapter using plugin system."""
+        # Imported lazily: plugin discovery is only needed once a simulator is used
+        from ..core.plugin_system import get_plugin_registry
         try:
             registry = get_plugin_registry()
             return registry.create_simulator(sim_name, project.config)
@@ -291,35 +569,43 @@ class SimulationHandler:
         """Auto-detect if tracing was enabled during compilation."""
         try:
             # Method 1: Check project configuration for default waves setting
-            if hasattr(project, 'default_waves') and project.default_waves:
+            if project.default_waves:
                 return True
             
             # Method 2: Look for build artifacts that indicate tracing was enabled
-            build_dir = Path(project.project_path) / 'work'
-            if build_dir.exists():
-                # Check for Verilator trace-related files
-                trace_files = list(build_dir.glob('*trace*')) + list(build_dir.glob('*vcd*'))
-                if trace_files:
-                    return True
-                
-                # Check makefiles for trace flags
-                makefiles = list(build_dir.glob('*.mk'))
-                for makefile in makefiles:
-                    try:
-                        content = makefile.read_text()
-                        if '--trace' in content or 'verilated_vcd' in content:
+            # (a single directory read classifies every entry by name)
+            makefiles = []
+            try:
+                with os.scandir(project.build_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        # Check for Verilator trace-related files
+                        if 'trace' in name or 'vcd' in name:
+                            return True
+                        if name.endswith('.mk') and entry.is_file(follow_symlinks=False):
+                            makefiles.append(entry.path)
+            except OSError:
+                pass  # No build directory yet
+            
+            # Check makefiles for trace flags
+            # (mapped read-only and searched as bytes, without decoding the file)
+            for makefile in makefiles:
+                try:
+                    with open(makefile, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if any(mm.find(marker) != -1 for marker in _MAKEFILE_TRACE_MARKERS):
                             return True
-                    except:
-                        pass
+                except (OSError, ValueError):
+                    pass  # Unreadable or empty makefile
             
             # Method 3: Check for existing waveform files in project directory
-            project_path = Path(project.project_path)
-            wave_files = (list(project_path.glob('*.vcd')) + 
-                         list(project_path.glob('*.fst')) +
-                         list(project_path.glob('*.ghw')))
-            if wave_files:
-                self.logger.info("Found existing waveform files - assuming tracing was enabled")
-                return True
+            try:
+                with os.scandir(project.config_path.parent) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(('.vcd', '.fst', '.ghw')):
+                            self.logger.info("Found existing waveform files - assuming tracing was enabled")
+                            return True
+            except OSError:
+                pass
             
             # Method 4: Default fallback - assume tracing is available
             # This is safer than assuming it's not available
@@ -335,33 +621,22 @@ class SimulationHandler:
         if not time_str:
             return None
         
-        # Regular expression to match number and optional unit
-        time_pattern = r'^(\d+(?:\.\d+)?)\s*([a-zA-Z]*)$'
-        match = re.match(time_pattern, time_str.strip())
+        match = _TIME_PATTERN.match(time_str.strip())
         
         if not match:
             self.logger.warning(f"Invalid time format: {time_str}, expected format: <number><unit> (e.g., 1000ns, 10us, 1ms)")
             return time_str  # Return as-is and let simulator handle it
         
         value, unit = match.groups()
-        unit = unit.lower() if unit else ''
+        unit = unit.lower()
         
         # Validate and normalize time units
-        valid_units = {
-            '': 'ns',      # Default to nanoseconds if no unit specified
-            'ps': 'ps',    # picoseconds
-            'ns': 'ns',    # nanoseconds  
-            'us': 'us',    # microseconds
-            'ms': 'ms',    # milliseconds
-            's': 's',      # seconds
-        }
-        
-        if unit not in valid_units:
-            self.logger.warning(f"Unknown time unit '{unit}', supported units: {list(valid_units.keys())}")
+        normalized_unit = _TIME_UNITS.get(unit)
+        if normalized_unit is None:
+            self.logger.warning(f"Unknown time unit '{unit}', supported units: {_TIME_UNITS_HELP}")
             return time_str  # Return as-is and let simulator handle it
         
         # Return formatted time string
-        normalized_unit = valid_units[unit]
         result = f"{value}{normalized_unit}"
         self.logger.debug(f"Parsed time parameter: {time_str} -> {result}")
         return result
@@ -377,7 +652,7 @@ class CleanupHandler:
         """Clean build artifacts."""
         try:
             # Load project configuration
-            project = Project()
+            project = _get_project()
             
             # Create simulator adapter for cleanup
             sim_name = project.default_simulator
@@ -386,8 +661,12 @@ class CleanupHandler:
             if verbose:
                 self.logger.info(f"Cleaning {sim_name} artifacts...")
             
-            # Clean
-            success = sim.clean()
+            # Clean per-top builds from compile_many first, then the main build directory
+            success = True
+            for top_dir in _per_top_build_dirs(project):
+                top_sim = self._create_simulator(sim_name, project.with_overrides(build_dir=str(top_dir)))
+                success = top_sim.clean() and success
+            success = sim.clean() and success
             
             if success:
                 self.logger.success("Clean completed")
@@ -407,6 +686,8 @@ class CleanupHandler:
     
     def _create_simulator(self, sim_name: str, project: Project):
         """Create simulator adapter using plugin system."""
+        # Imported lazily: plugin discovery is only needed once a simulator is used
+        from ..core.plugin_system import get_plugin_registry
         try:
             registry = get_plugin_registry()
             return registry.create_simulator(sim_name, project.config)
@@ -427,36 +708,41 @@ class DoctorHandler:
     
     def check_system(self) -> bool:
         """Check tool installation and environment."""
-        self.logger.header("Checking simulator installations:")
-        
-        # Check Verilator
-        self._check_verilator()
-        
-        # Check other tools
-        self.logger.header("\nChecking other tools:")
         other_tools = ['gtkwave', 'make', 'cmake']
         
-        for tool in other_tools:
-            if shutil.which(tool):
-                self.logger.success(f"{tool}: Found")
-            else:
-                self.logger.warning(f"{tool}: Not found (optional)")
+        # Probe all tools concurrently, then report in a fixed order
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(other_tools) + 1) as executor:
+            verilator_future = executor.submit(self._probe_verilator)
+            tool_futures = [(tool, executor.submit(_which, tool)) for tool in other_tools]
+            
+            self.logger.header("Checking simulator installations:")
+            
+            # Check Verilator
+            self._check_verilator(*verilator_future.result())
+            
+            # Check other tools
+            self.logger.header("\nChecking other tools:")
+            for tool, future in tool_futures:
+                if future.result():
+                    self.logger.success(f"{tool}: Found")
+                else:
+                    self.logger.warning(f"{tool}: Not found (optional)")
         
         return True
     
-    def _check_verilator(self):
-        """Check Verilator installation and version."""
-        verilator_path = shutil.which('verilator')
-        if verilator_path:
-            try:
-                result = subprocess.run(['verilator', '--version'], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    version_line = result.stdout.strip().split('\n')[0]
-                    self.logger.success(f"Verilator: {version_line}")
-                else:
-                    self.logger.error("Verilator: Found but error getting version")
-            except Exception:
-                self.logger.error("Verilator: Found but error getting version")
+    def _probe_verilator(self) -> Tuple[bool, Optional[str]]:
+        """Locate Verilator and read its version line (runs in a worker thread)."""
+        verilator_path = _which('verilator')
+        if not verilator_path:
+            return False, None
+        return True, _verilator_version(verilator_path)
+    
+    def _check_verilator(self, found: bool, version_line: Optional[str]):
+        """Report Verilator installation and version."""
+        if not found:
+            self.logger.error("Verilator: Not found")
+        elif version_line is None:
+            self.logger.error("Verilator: Found but error getting version")
         else:
-            self.logger.error("Verilator: Not found")
\ No newline at end of file
+            self.logger.success(f"Verilator: {version_line}")
@@ -9,6 +9,8 @@ from typing import List, Dict, Any
 class DefaultPaths:
     """Default directory and file paths for SimTool projects."""
     
+    __slots__ = ()
+    
     # Default directories created during project initialization
     RTL_DIR = "rtl"
     TESTBENCH_DIR = "tb"
@@ -21,9 +23,17 @@ class DefaultPaths:
     
     # Configuration file
     CONFIG_FILE = "simtool.cfg"
+    # Suffix of the parsed-config JSON caches kept in the user cache directory
+    CONFIG_CACHE_SUFFIX = ".cache.json"
+    # Subdirectory of $XDG_CACHE_HOME (default ~/.cache) holding SimTool caches
+    USER_CACHE_DIR = "simtool"
+    
+    # Build manifest used to skip no-op recompiles (lives in the build directory)
+    BUILD_MANIFEST = ".simtool_manifest.json"
     
     # Common file extensions
     RTL_EXTENSIONS = ["*.sv", "*.v", "*.vhd"]
+    RTL_SUFFIX_TUPLE = (".sv", ".v", ".vhd")  # For str.endswith / suffix lookups
     PYTHON_EXTENSION = "*.py"
     SV_EXTENSION = "*.sv"
     CPP_EXTENSION = "*.cpp"
@@ -36,6 +46,8 @@ class DefaultPaths:
 class DefaultConfig:
     """Default configuration values for SimTool."""
     
+    __slots__ = ()
+    
     SIMULATOR = "verilator"
     WAVES_ENABLED = True
     INCLUDE_PATHS: List[str] = []
@@ -50,6 +62,8 @@ class DefaultConfig:
 class ProjectStructureMessages:
     """Messages for project structure display."""
     
+    __slots__ = ()
+    
     RTL_DESC = "RTL source files"
     TB_DESC = "Testbench files"
     WORK_DESC = "Build artifacts (like ModelSim work library)"
@@ -59,6 +73,8 @@ class ProjectStructureMessages:
 class SimulatorTypes:
     """Supported simulator types."""
     
+    __slots__ = ()
+    
     VERILATOR = "verilator"
     ICARUS = "icarus"
     QUESTA = "questa"
@@ -70,6 +86,8 @@ class SimulatorTypes:
 class TestbenchTypes:
     """Supported testbench types."""
     
+    __slots__ = ()
+    
     AUTO = "auto"
     COCOTB = "cocotb"
     SYSTEMVERILOG = "sv"
@@ -81,6 +99,8 @@ class TestbenchTypes:
 class VCDPatterns:
     """Patterns for detecting VCD dumping in testbenches."""
     
+    __slots__ = ()
+    
     DUMPFILE_PATTERNS = ["$dumpfile", "$dumpvars"]
     COCOTB_IMPORT = "import cocotb"
     COCOTB_TEST = "@cocotb.test"
@@ -91,6 +111,8 @@ class VCDPatterns:
 class PluginPaths:
     """Plugin search paths."""
     
+    __slots__ = ()
+    
     USER_PLUGINS = Path.home() / '.simtool' / 'plugins'
     SYSTEM_PLUGINS = [
         Path('/usr/local/share/simtool/plugins'),
@@ -2,32 +2,99 @@
 SimTool custom exceptions with better error context.
 """
 
-import traceback
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 
+# Canned suggestions shared by every instance of the matching exception type
+_COMPILE_SUGGESTIONS = (
+    "Check syntax errors in your RTL files",
+    "Verify include paths and file dependencies",
+    "Run with --verbose for more detailed output",
+)
+_SIMULATION_SUGGESTIONS = (
+    "Run 'simtool vlog' first to compile your design",
+    "Check testbench logic and simulation time limits",
+)
+_FILE_DISCOVERY_SUGGESTIONS = (
+    "Check that your files exist in the expected directories",
+    "Verify rtl_paths and tb_paths in your simtool.cfg",
+    "Use absolute paths or run from project root directory",
+)
+_PLUGIN_SUGGESTIONS = (
+    "Check plugin compatibility with SimTool version",
+    "Verify plugin dependencies are installed",
+    "Check plugin file permissions and syntax",
+)
+
+# (exception type keywords, message keywords, suggestions) for get_exception_suggestions
+_SUGGESTION_TABLE = (
+    (("filenotfound",), ("no such file",), (
+        "Check that the file path is correct",
+        "Verify you're running from the correct directory",
+        "Ensure the file exists and has proper permissions"
+    )),
+    ((), ("permission",), (
+        "Check file permissions",
+        "Try running with appropriate privileges",
+        "Ensure the file is not locked by another process"
+    )),
+    ((), ("timeout",), (
+        "Check if the process is hanging",
+        "Try increasing timeout values",
+        "Verify system resources are available"
+    )),
+    ((), ("import", "module"), (
+        "Check that required Python packages are installed",
+        "Verify your Python environment and PATH",
+        "Try reinstalling the missing package"
+    )),
+)
+
+
 class SimToolError(Exception):
     """Base exception class for SimTool with enhanced error context."""
     
+    # Slots keep instances from ever materializing the (lazily created) exception __dict__
+    __slots__ = ('_context', '_suggestions')
+    
     def __init__(self, message: str, context: Optional[Dict[str, Any]] = None, 
                  suggestions: Optional[List[str]] = None):
         super().__init__(message)
-        self.context = context or {}
-        self.suggestions = suggestions or []
+        # Kept as None until first accessed so context-free errors allocate nothing extra
+        self._context = context or None
+        self._suggestions = suggestions or None
+    
+    def __reduce__(self):
+        # Slot values are not part of the default exception pickle state
+        return (self.__class__, self.args, {'_context': self._context, '_suggestions': self._suggestions})
+    
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Error context (created on first access)."""
+        if self._context is None:
+            self._context = {}
+        return self._context
+    
+    @property
+    def suggestions(self) -> List[str]:
+        """Suggestions for resolving the error (created on first access)."""
+        if self._suggestions is None:
+            self._suggestions = []
+        return self._suggestions
     
     def get_detailed_message(self) -> str:
         """Get detailed error message with context and suggestions."""
         lines = [str(self)]
         
-        if self.context:
+        if self._context:
             lines.append("\nError Context:")
-            for key, value in self.context.items():
+            for key, value in self._context.items():
                 lines.append(f"  {key}: {value}")
         
-        if self.suggestions:
+        if self._suggestions:
             lines.append("\nSuggestions:")
-            for i, suggestion in enumerate(self.suggestions, 1):
+            for i, suggestion in enumerate(self._suggestions, 1):
                 lines.append(f"  {i}. {suggestion}")
         
         return "\n".join(lines)
@@ -36,9 +103,13 @@ class SimToolError(Exception):
 class ProjectConfigError(SimToolError):
     """Raised when project configuration is invalid or missing."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, config_path: Optional[Path] = None, 
                  field: Optional[str] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.get('context')
+        if context is None and (config_path or field):
+            context = {}
         if config_path:
             context['config_file'] = str(config_path)
         if field:
@@ -57,6 +128,8 @@ class ProjectConfigError(SimToolError):
 class SimulatorNotFoundError(SimToolError):
     """Raised when a requested simulator is not available."""
     
+    __slots__ = ()
+    
     def __init__(self, simulator_name: str, available_simulators: Optional[List[str]] = None, **kwargs):
         message = f"Simulator '{simulator_name}' is not available"
         
@@ -79,9 +152,13 @@ class SimulatorNotFoundError(SimToolError):
 class CompilationFailedError(SimToolError):
     """Raised when RTL compilation fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, simulator: Optional[str] = None, 
                  files: Optional[List[Path]] = None, stderr: Optional[str] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.get('context')
+        if context is None and (simulator or files or stderr):
+            context = {}
         if simulator:
             context['simulator'] = simulator
         if files:
@@ -89,11 +166,7 @@ class CompilationFailedError(SimToolError):
         if stderr:
             context['compiler_output'] = stderr
         
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions.append("Check syntax errors in your RTL files")
-            suggestions.append("Verify include paths and file dependencies")
-            suggestions.append("Run with --verbose for more detailed output")
+        suggestions = kwargs.get('suggestions') or list(_COMPILE_SUGGESTIONS)
         
         super().__init__(message, context, suggestions)
 
@@ -101,9 +174,13 @@ class CompilationFailedError(SimToolError):
 class SimulationFailedError(SimToolError):
     """Raised when simulation execution fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, module: Optional[str] = None, 
                  executable: Optional[Path] = None, stderr: Optional[str] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.get('context')
+        if context is None and (module or executable or stderr):
+            context = {}
         if module:
             context['top_module'] = module
         if executable:
@@ -111,10 +188,9 @@ class SimulationFailedError(SimToolError):
         if stderr:
             context['simulation_output'] = stderr
         
-        suggestions = kwargs.get('suggestions', [])
+        suggestions = kwargs.get('suggestions')
         if not suggestions:
-            suggestions.append("Run 'simtool vlog' first to compile your design")
-            suggestions.append("Check testbench logic and simulation time limits")
+            suggestions = list(_SIMULATION_SUGGESTIONS)
             if not executable or not executable.exists():
                 suggestions.append("Verify the executable was generated during compilation")
         
@@ -124,19 +200,19 @@ class SimulationFailedError(SimToolError):
 class FileDiscoveryError(SimToolError):
     """Raised when required files cannot be found."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, search_paths: Optional[List[Path]] = None, 
                  patterns: Optional[List[str]] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.get('context')
+        if context is None and (search_paths or patterns):
+            context = {}
         if search_paths:
             context['search_paths'] = [str(p) for p in search_paths]
         if patterns:
             context['file_patterns'] = patterns
         
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions.append("Check that your files exist in the expected directories")
-            suggestions.append("Verify rtl_paths and tb_paths in your simtool.cfg")
-            suggestions.append("Use absolute paths or run from project root directory")
+        suggestions = kwargs.get('suggestions') or list(_FILE_DISCOVERY_SUGGESTIONS)
         
         super().__init__(message, context, suggestions)
 
@@ -144,6 +220,8 @@ class FileDiscoveryError(SimToolError):
 class ToolNotFoundError(SimToolError):
     """Raised when required external tools are not found."""
     
+    __slots__ = ()
+    
     def __init__(self, tool_name: str, install_command: Optional[str] = None, **kwargs):
         message = f"Required tool '{tool_name}' not found in PATH"
         
@@ -163,19 +241,19 @@ class ToolNotFoundError(SimToolError):
 class PluginError(SimToolError):
     """Raised when plugin loading or execution fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, plugin_name: Optional[str] = None, 
                  plugin_path: Optional[Path] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.get('context')
+        if context is None and (plugin_name or plugin_path):
+            context = {}
         if plugin_name:
             context['plugin_name'] = plugin_name
         if plugin_path:
             context['plugin_path'] = str(plugin_path)
         
-        suggestions = kwargs.get('suggestions', [])
-        if not suggestions:
-            suggestions.append("Check plugin compatibility with SimTool version")
-            suggestions.append("Verify plugin dependencies are installed")
-            suggestions.append("Check plugin file permissions and syntax")
+        suggestions = kwargs.get('suggestions') or list(_PLUGIN_SUGGESTIONS)
         
         super().__init__(message, context, suggestions)
 
@@ -204,37 +282,12 @@ def format_exception_with_context(exc: Exception, additional_context: Optional[D
 
 def get_exception_suggestions(exc: Exception) -> List[str]:
     """Get suggestions for common exception types."""
-    exc_type = type(exc).__name__
+    exc_type = type(exc).__name__.lower()
     message = str(exc).lower()
     
-    suggestions = []
-    
-    if "filenotfound" in exc_type.lower() or "no such file" in message:
-        suggestions.extend([
-            "Check that the file path is correct",
-            "Verify you're running from the correct directory",
-            "Ensure the file exists and has proper permissions"
-        ])
-    
-    elif "permission" in message:
-        suggestions.extend([
-            "Check file permissions",
-            "Try running with appropriate privileges",
-            "Ensure the file is not locked by another process"
-        ])
-    
-    elif "timeout" in message:
-        suggestions.extend([
-            "Check if the process is hanging",
-            "Try increasing timeout values",
-            "Verify system resources are available"
-        ])
-    
-    elif "import" in message or "module" in message:
-        suggestions.extend([
-            "Check that required Python packages are installed",
-            "Verify your Python environment and PATH",
-            "Try reinstalling the missing package"
-        ])
-    
-    return suggestions
\ No newline at end of file
+    # First matching entry wins, mirroring a plain if/elif chain
+    for type_keywords, message_keywords, suggestions in _SUGGESTION_TABLE:
+        if any(k in exc_type for k in type_keywords) or any(k in message for k in message_keywords):
+            return list(suggestions)
+    
+    return []
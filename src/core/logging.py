@@ -35,37 +35,31 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: '💥',
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Color + symbol prefix per level, built once instead of per record
+        self._prefixes = {level: f"{color}{self.SYMBOLS.get(level, '')} " for level, color in self.COLORS.items()}
+    
     def format(self, record):
-        # Get color and symbol for log level
-        color = self.COLORS.get(record.levelno, '')
-        symbol = self.SYMBOLS.get(record.levelno, '')
-        
-        # Format the message
-        if hasattr(record, 'no_symbol') and record.no_symbol:
-            # Skip symbol for certain messages (like command output)
-            formatted = f"{color}{record.getMessage()}{Colors.RESET}"
+        # Skip symbol for certain messages (like command output)
+        if getattr(record, 'no_symbol', False):
+            prefix = self.COLORS.get(record.levelno, '')
         else:
-            formatted = f"{color}{symbol} {record.getMessage()}{Colors.RESET}"
+            prefix = self._prefixes.get(record.levelno, ' ')
         
-        return formatted
+        return f"{prefix}{record.getMessage()}{Colors.RESET}"
 
 
 class SimToolLogger:
-    """Centralized logger for SimTool with consistent formatting."""
+    """Centralized logger for SimTool with consistent formatting.
     
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    The shared instance is the module-level ``logger``; use get_logger() rather
+    than constructing another one (which would reconfigure the handlers).
+    """
     
     def __init__(self):
-        if not self._initialized:
-            self.logger = logging.getLogger('simtool')
-            self.setup_logging()
-            self._initialized = True
+        self.logger = logging.getLogger('simtool')
+        self.setup_logging()
     
     def setup_logging(self, level: int = logging.INFO, log_file: Optional[Path] = None):
         """Setup logging configuration."""
@@ -101,44 +95,59 @@ class SimToolLogger:
             if isinstance(handler, logging.StreamHandler):
                 handler.setLevel(level)
     
-    def debug(self, message: str, **kwargs):
-        """Log debug message."""
-        self.logger.debug(message, extra=kwargs)
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a message at this level would be emitted."""
+        return self.logger.isEnabledFor(level)
+    
+    def debug(self, message: str, *args, **kwargs):
+        """Log debug message (optional %-style args are formatted lazily)."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, *args, extra=kwargs)
     
-    def info(self, message: str, **kwargs):
-        """Log info message."""
-        self.logger.info(message, extra=kwargs)
+    def info(self, message: str, *args, **kwargs):
+        """Log info message (optional %-style args are formatted lazily)."""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, *args, extra=kwargs)
     
-    def warning(self, message: str, **kwargs):
-        """Log warning message."""
-        self.logger.warning(message, extra=kwargs)
+    def warning(self, message: str, *args, **kwargs):
+        """Log warning message (optional %-style args are formatted lazily)."""
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(message, *args, extra=kwargs)
     
-    def error(self, message: str, **kwargs):
-        """Log error message."""
-        self.logger.error(message, extra=kwargs)
+    def error(self, message: str, *args, **kwargs):
+        """Log error message (optional %-style args are formatted lazily)."""
+        self.logger.error(message, *args, extra=kwargs)
     
-    def critical(self, message: str, **kwargs):
-        """Log critical message."""
-        self.logger.critical(message, extra=kwargs)
+    def critical(self, message: str, *args, **kwargs):
+        """Log critical message (optional %-style args are formatted lazily)."""
+        self.logger.critical(message, *args, extra=kwargs)
     
     def success(self, message: str, **kwargs):
         """Log success message (info level with success formatting)."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         # Custom success logging
         colored_msg = f"{Colors.SUCCESS}{message}{Colors.RESET}"
         self.logger.info(colored_msg, extra={'no_symbol': True, **kwargs})
     
     def progress(self, message: str, **kwargs):
         """Log progress message."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         colored_msg = f"{Colors.CYAN}> {message}{Colors.RESET}"
         self.logger.info(colored_msg, extra={'no_symbol': True, **kwargs})
     
     def command(self, message: str, **kwargs):
         """Log command execution."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         colored_msg = f"{Colors.COMMAND}{message}{Colors.RESET}"
         self.logger.info(colored_msg, extra={'no_symbol': True, **kwargs})
     
     def header(self, message: str, **kwargs):
         """Log header message."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         colored_msg = f"{Colors.BRIGHT}{Colors.BLUE}{message}{Colors.RESET}"
         self.logger.info(colored_msg, extra={'no_symbol': True, **kwargs})
 
@@ -4,16 +4,20 @@ Plugin system for SimTool simulator extensibility.
 
 import importlib
 import importlib.util
-import inspect
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Type, Optional, Any
+from typing import Dict, List, Type, Optional, Any, Tuple
 from dataclasses import dataclass
 
 from .logging import get_logger
+from .constants import PluginPaths
 from ..toolchain.base import ISimulator
 
 
+# Seconds a plugin availability probe result is reused before re-probing
+_AVAILABILITY_TTL = 30.0
+
 @dataclass
 class PluginMetadata:
     """Plugin metadata."""
@@ -55,9 +59,14 @@ class PluginRegistry:
     def __init__(self):
         self.logger = get_logger()
         self._plugins: Dict[str, ISimulatorPlugin] = {}
+        self._availability_cache: Dict[str, Tuple[float, bool]] = {}
+        self._names_cache: Optional[Tuple[str, ...]] = None
         self._builtin_simulators = {
             'verilator': 'src.toolchain.verilator:VerilatorPlugin'
         }
+        # External plugin directories are only scanned once a non-builtin plugin is needed
+        self._external_dirs: List[Path] = [PluginPaths.USER_PLUGINS, *PluginPaths.SYSTEM_PLUGINS]
+        self._external_loaded = False
     
     def register_plugin(self, plugin: ISimulatorPlugin) -> None:
         """
@@ -72,6 +81,8 @@ class PluginRegistry:
             self.logger.warning(f"Plugin '{name}' already registered, replacing")
         
         self._plugins[name] = plugin
+        self._availability_cache.pop(name, None)
+        self._names_cache = None
         self.logger.debug(f"Registered plugin: {name}")
     
     def get_plugin(self, name: str) -> Optional[ISimulatorPlugin]:
@@ -84,23 +95,45 @@ class PluginRegistry:
         Returns:
             Plugin instance or None if not found
         """
-        return self._plugins.get(name.lower())
+        name = name.lower()
+        if name not in self._plugins:
+            self._load_external_plugins()
+        return self._plugins.get(name)
     
     def list_plugins(self) -> List[str]:
         """Get list of registered plugin names."""
-        return list(self._plugins.keys())
+        self._load_external_plugins()
+        if self._names_cache is None:
+            self._names_cache = tuple(self._plugins)
+        return list(self._names_cache)
     
     def list_available_plugins(self) -> List[str]:
         """Get list of available (installed) plugin names."""
+        self._load_external_plugins()
         available = []
         for name, plugin in self._plugins.items():
             try:
-                if plugin.is_available():
+                if self._is_available(name, plugin):
                     available.append(name)
             except Exception as e:
                 self.logger.debug(f"Error checking availability of plugin '{name}': {e}")
         return available
     
+    def invalidate_availability(self) -> None:
+        """Forget cached availability results so the next check re-probes."""
+        self._availability_cache.clear()
+    
+    def _is_available(self, name: str, plugin: ISimulatorPlugin) -> bool:
+        """Check plugin availability, reusing a recent probe result."""
+        now = time.monotonic()
+        cached = self._availability_cache.get(name)
+        if cached is not None and now - cached[0] < _AVAILABILITY_TTL:
+            return cached[1]
+        
+        available = plugin.is_available()
+        self._availability_cache[name] = (now, available)
+        return available
+    
     def create_simulator(self, name: str, config: Dict[str, Any]) -> ISimulator:
         """
         Create simulator instance from plugin.
@@ -119,7 +152,7 @@ class PluginRegistry:
         if plugin is None:
             raise ValueError(f"Simulator plugin '{name}' not found")
         
-        if not plugin.is_available():
+        if not self._is_available(name.lower(), plugin):
             raise ValueError(f"Simulator '{name}' is not available on this system")
         
         return plugin.create_adapter(config)
@@ -154,6 +187,14 @@ class PluginRegistry:
             except Exception as e:
                 self.logger.error(f"Failed to load plugin from '{plugin_file}': {e}")
     
+    def _load_external_plugins(self) -> None:
+        """Load plugins from the standard plugin directories (once)."""
+        if self._external_loaded:
+            return
+        self._external_loaded = True
+        for plugin_dir in self._external_dirs:
+            self.load_plugins_from_directory(plugin_dir)
+    
     def _load_plugin_from_path(self, module_path: str) -> None:
         """Load plugin from module path (module:class format)."""
         if ':' not in module_path:
@@ -185,9 +226,10 @@ class PluginRegistry:
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
         
-        # Find plugin classes in module
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if (issubclass(obj, ISimulatorPlugin) and 
+        # Find plugin classes defined in the module (no sorted getmembers/getattr pass)
+        for obj in vars(module).values():
+            if (isinstance(obj, type) and
+                issubclass(obj, ISimulatorPlugin) and 
                 obj is not ISimulatorPlugin and 
                 obj.__module__ == module.__name__):
                 
@@ -207,15 +249,6 @@ def get_plugin_registry() -> PluginRegistry:
     if _registry is None:
         _registry = PluginRegistry()
         _registry.load_builtin_plugins()
-        
-        # Load plugins from standard locations
-        plugin_dirs = [
-            Path.home() / '.simtool' / 'plugins',
-            Path('/usr/local/share/simtool/plugins'),
-            Path('/opt/simtool/plugins')
-        ]
-        
-        for plugin_dir in plugin_dirs:
-            _registry.load_plugins_from_directory(plugin_dir)
+        # Plugins from standard locations are loaded on first lookup of a non-builtin
     
     return _registry
\ No newline at end of file
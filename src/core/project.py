@@ -2,16 +2,98 @@
 SimTool project configuration and management.
 """
 
-import yaml
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple
 try:
-    from .validation import ConfigValidator, ConfigValidationError, create_default_config
+    from .validation import ConfigValidator, ConfigValidationError
     from .logging import get_logger
+    from .constants import DefaultPaths, VCDPatterns
 except ImportError:
     # Fallback for absolute imports
-    from validation import ConfigValidator, ConfigValidationError, create_default_config
+    from validation import ConfigValidator, ConfigValidationError
     from core.logging import get_logger
+    from core.constants import DefaultPaths, VCDPatterns
+
+
+# Content markers are combined into one alternation so each file is scanned in a single pass.
+# Matching is done on raw bytes so files never need decoding.
+_SV_MODULE_MARKER = b'module'
+_MAIN_MARKER = VCDPatterns.MAIN_FUNCTION.encode()
+_COCOTB_MARKER_SET = frozenset(m.encode() for m in (VCDPatterns.COCOTB_IMPORT, VCDPatterns.COCOTB_TEST))
+_SV_INDICATOR_SET = frozenset(m.encode() for m in (VCDPatterns.TB_SUFFIX, *VCDPatterns.DUMPFILE_PATTERNS, '$finish'))
+_TB_MARKERS = re.compile(b'|'.join(map(re.escape, (
+    *_COCOTB_MARKER_SET, _SV_MODULE_MARKER, *_SV_INDICATOR_SET, _MAIN_MARKER
+))))
+
+# Characters that make a glob pattern more than a literal suffix match
+_GLOB_MAGIC = re.compile(r'[*?\[\]/]')
+
+# Suffixes of files that may be testbenches
+_TB_SUFFIXES = ('.py', '.sv', '.cpp')
+
+# Below this many candidates, pool startup costs more than the reads it would overlap
+_TB_POOL_MIN_CANDIDATES = 4
+
+# (is_cocotb, is_sv_content, has_main) per absolute path, with the mtime/size it was computed for.
+# Least recently used first; the lock keeps LRU updates from classifier threads consistent.
+_TB_SCAN_CACHE: "OrderedDict[str, Tuple[int, int, Tuple[bool, bool, bool]]]" = OrderedDict()
+_TB_SCAN_CACHE_SIZE = 1024
+_TB_SCAN_LOCK = threading.Lock()
+_NO_MARKERS = (False, False, False)
+
+
+def _scan_testbench_content(file_path: Path) -> Tuple[bool, bool, bool]:
+    """Classify a file's testbench markers, reading it at most once per revision."""
+    try:
+        path = os.path.abspath(file_path)
+        st = os.stat(path)
+        with _TB_SCAN_LOCK:
+            cached = _TB_SCAN_CACHE.get(path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                _TB_SCAN_CACHE.move_to_end(path)
+                return cached[2]
+        # Unbuffered: a single readall() needs no BufferedReader in between
+        with open(path, 'rb', buffering=0) as f:
+            content = f.read()
+    except OSError:
+        return _NO_MARKERS
+    
+    found = set(_TB_MARKERS.findall(content))
+    markers = (
+        not found.isdisjoint(_COCOTB_MARKER_SET),
+        _SV_MODULE_MARKER in found and not found.isdisjoint(_SV_INDICATOR_SET),
+        _MAIN_MARKER in found,
+    )
+    with _TB_SCAN_LOCK:
+        _TB_SCAN_CACHE[path] = (st.st_mtime_ns, st.st_size, markers)
+        _TB_SCAN_CACHE.move_to_end(path)
+        if len(_TB_SCAN_CACHE) > _TB_SCAN_CACHE_SIZE:
+            _TB_SCAN_CACHE.popitem(last=False)
+    return markers
+
+
+def _iter_tb_candidates(root: Path) -> Iterator[Tuple[str, Path]]:
+    """Yield (suffix, path) for .py/.sv/.cpp files under root in a single walk."""
+    # Explicit stack; subdirectories are pushed in reverse so the walk stays pre-order
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                subdirs = []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(_TB_SUFFIXES) and entry.is_file():
+                        yield os.path.splitext(entry.name)[1], Path(entry.path)
+        except OSError:
+            continue  # Missing or unreadable directory
+        stack.extend(reversed(subdirs))
 
 
 class Project:
@@ -29,7 +111,7 @@ class Project:
             raise FileNotFoundError(f"Project config not found: {self.config_path}")
         
         try:
-            # Load and validate configuration
+            # Load and validate configuration (memoized per file revision by the validator)
             config = ConfigValidator.validate_yaml_file(self.config_path)
             logger.debug(f"Configuration loaded and validated from {self.config_path}")
             return config
@@ -40,37 +122,49 @@ class Project:
             logger.error(f"Error loading configuration: {e}")
             raise
     
-    @property
+    @cached_property
     def build_dir(self) -> Path:
         """Get build directory path."""
         return Path(self.config.get('build_dir', 'work'))
     
-    @property 
+    @cached_property
     def rtl_paths(self) -> List[Path]:
         """Get RTL source paths."""
         paths = self.config.get('rtl_paths', ['rtl'])
         return [Path(p) for p in paths]
     
-    @property
+    @cached_property
     def tb_paths(self) -> List[Path]:
         """Get testbench paths.""" 
         paths = self.config.get('tb_paths', ['tb'])
         return [Path(p) for p in paths]
         
-    @property
+    @cached_property
     def default_simulator(self) -> str:
         """Get default simulator."""
         return self.config.get('default_simulator', 'verilator')
         
-    @property
+    @cached_property
     def default_waves(self) -> bool:
         """Get default waves setting."""
         return self.config.get('default_waves', True)
     
+    def with_overrides(self, **overrides: Any) -> 'Project':
+        """Return a copy of this project with some config values replaced."""
+        # Built fresh (not copied) so no cached property values carry over
+        project = Project.__new__(Project)
+        project.config_path = self.config_path
+        project.config = {**self.config, **overrides}
+        return project
+    
     def get_rtl_files(self, patterns: List[str] = None) -> List[Path]:
         """Find RTL files matching patterns."""
         if patterns is None:
-            patterns = ['*.sv', '*.v', '*.vhd']
+            return self._scan_rtl_files(DefaultPaths.RTL_SUFFIX_TUPLE)
+        
+        # Plain '*.ext' patterns are matched by suffix in one directory read
+        if all(p.startswith('*.') and not _GLOB_MAGIC.search(p[1:]) for p in patterns):
+            return self._scan_rtl_files(tuple(p[1:] for p in patterns))
             
         files = []
         for rtl_path in self.rtl_paths:
@@ -79,71 +173,86 @@ class Project:
                     files.extend(rtl_path.glob(pattern))
         return files
     
+    def _scan_rtl_files(self, suffixes: Tuple[str, ...]) -> List[Path]:
+        """Find RTL files by suffix with one directory read per RTL path."""
+        files = []
+        for rtl_path in self.rtl_paths:
+            # Bucket by suffix so files keep the per-pattern order glob would give
+            buckets = {suffix: [] for suffix in suffixes}
+            try:
+                with os.scandir(rtl_path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        suffix = next((s for s in suffixes if name.endswith(s)), None)
+                        if suffix is not None and entry.is_file():
+                            buckets[suffix].append(rtl_path / name)
+            except OSError:
+                continue  # RTL path does not exist
+            for bucket in buckets.values():
+                files.extend(bucket)
+        return files
+    
     def get_tb_files(self, tb_type: str = 'auto') -> List[Path]:
         """Find testbench files."""
+        return self.find_testbenches(tb_type)[0]
+    
+    def find_testbenches(self, tb_type: str = 'auto') -> Tuple[List[Path], str]:
+        """Find testbench files and their detected type in a single classification pass."""
         files = []
+        detected = 'none'
+        find_cocotb = tb_type == 'auto' or tb_type == 'cocotb'
+        find_sv = tb_type == 'auto' or tb_type == 'sv'
         
         for tb_path in self.tb_paths:
-            if not tb_path.exists():
+            # One walk collects every candidate of a requested kind
+            candidates = [(suffix, file) for suffix, file in _iter_tb_candidates(tb_path)
+                          if (find_cocotb if suffix == '.py' else find_sv)]
+            if not candidates:
                 continue
-                
-            if tb_type == 'auto' or tb_type == 'cocotb':
-                # Find cocotb testbenches
-                for py_file in tb_path.rglob('*.py'):
-                    if self._is_cocotb_testbench(py_file):
-                        files.append(py_file)
             
-            if tb_type == 'auto' or tb_type == 'sv':
-                # Find SystemVerilog testbenches
-                for sv_file in tb_path.rglob('*.sv'):
-                    if self._is_sv_testbench(sv_file):
-                        files.append(sv_file)
-                        
-                for cpp_file in tb_path.rglob('*.cpp'):
-                    if self._is_cpp_testbench(cpp_file):
-                        files.append(cpp_file)
-                        
-        return files
+            # Classification is I/O-bound, so overlap the file reads across threads for larger sets
+            if len(candidates) < _TB_POOL_MIN_CANDIDATES:
+                hits = [self._is_tb_candidate(*candidate) for candidate in candidates]
+            else:
+                with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+                    hits = list(executor.map(lambda candidate: self._is_tb_candidate(*candidate), candidates))
+            
+            # Results keep the cocotb, SV, C++ grouping
+            for group in _TB_SUFFIXES:
+                group_files = [file for (suffix, file), hit in zip(candidates, hits) if hit and suffix == group]
+                if group_files:
+                    # The first file found decides the type, as in detect_testbench_type()
+                    if not files:
+                        detected = 'cocotb' if group == '.py' else 'sv'
+                    files.extend(group_files)
+        
+        return files, detected
+    
+    def _is_tb_candidate(self, suffix: str, file_path: Path) -> bool:
+        """Dispatch a testbench candidate to the classifier for its suffix."""
+        if suffix == '.py':
+            return self._is_cocotb_testbench(file_path)
+        elif suffix == '.sv':
+            return self._is_sv_testbench(file_path)
+        return self._is_cpp_testbench(file_path)
     
     def _is_cocotb_testbench(self, file_path: Path) -> bool:
         """Check if Python file is a cocotb testbench."""
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                return 'import cocotb' in content or '@cocotb.test' in content
-        except:
-            return False
+        return _scan_testbench_content(file_path)[0]
     
     def _is_sv_testbench(self, file_path: Path) -> bool:
         """Check if SystemVerilog file is a testbench."""
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                # Check for common testbench naming patterns
-                filename_indicators = (
-                    '_tb' in file_path.stem or 
-                    file_path.stem.startswith('test_') or
-                    file_path.stem.endswith('_test')
-                )
-                # Check for testbench patterns in content
-                content_indicators = (
-                    '_tb' in content or
-                    '$dumpfile' in content or
-                    '$dumpvars' in content or
-                    '$finish' in content
-                )
-                return filename_indicators or (('module' in content) and content_indicators)
-        except:
-            return False
+        # Check for common testbench naming patterns (no file read needed)
+        if ('_tb' in file_path.stem or 
+                file_path.stem.startswith('test_') or
+                file_path.stem.endswith('_test')):
+            return True
+        # Otherwise need a module declaration plus any testbench pattern in content
+        return _scan_testbench_content(file_path)[1]
             
     def _is_cpp_testbench(self, file_path: Path) -> bool:
         """Check if C++ file is a testbench."""
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                return '_tb' in file_path.stem or 'main(' in content
-        except:
-            return False
+        return '_tb' in file_path.stem or _scan_testbench_content(file_path)[2]
     
     def detect_testbench_type(self, files: List[Path]) -> str:
         """Auto-detect testbench type from files."""
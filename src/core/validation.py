@@ -2,10 +2,81 @@
 Configuration validation for SimTool projects.
 """
 
+import copy
+import hashlib
+import json
+import os
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import yaml
-from dataclasses import dataclass
+from dataclasses import dataclass, field as dataclass_field
+try:
+    from .constants import DefaultPaths
+except ImportError:
+    # Fallback for absolute imports
+    from core.constants import DefaultPaths
+
+try:
+    # libyaml-backed loader is much faster when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Sentinel for absent config fields (None is a valid field value)
+_MISSING = object()
+
+# Validated configs keyed by (resolved path, mtime_ns, size), least recently used first.
+# Only successful validations are stored, so a broken config is re-checked every time.
+_YAML_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_YAML_CACHE_SIZE = 32
+
+
+def _config_sidecar_path(config_path: Path) -> Path:
+    """Path of the parsed-config JSON cache for a config file, in the user cache directory."""
+    # Kept out of the project tree; one file per config, named by its resolved path
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    digest = hashlib.blake2b(str(config_path.resolve()).encode(), digest_size=16).hexdigest()
+    return Path(cache_home) / DefaultPaths.USER_CACHE_DIR / f"config-{digest}{DefaultPaths.CONFIG_CACHE_SUFFIX}"
+
+
+def _read_config_sidecar(config_path: Path, cfg_stat: os.stat_result, rules_version: str) -> Optional[Dict[str, Any]]:
+    """Return the cached config if it matches the config file revision and validation rules."""
+    try:
+        with open(_config_sidecar_path(config_path), 'rb') as f:
+            cached = json.load(f)
+        if (cached['mtime_ns'] == cfg_stat.st_mtime_ns and cached['size'] == cfg_stat.st_size
+                and cached['rules'] == rules_version):
+            return cached['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing, stale or corrupt cache
+    return None
+
+
+def _write_config_sidecar(config_path: Path, cfg_stat: os.stat_result, rules_version: str,
+                          config: Dict[str, Any]) -> None:
+    """Cache a parsed config as JSON (skipped if it does not round-trip)."""
+    try:
+        payload = json.dumps({'mtime_ns': cfg_stat.st_mtime_ns, 'size': cfg_stat.st_size,
+                              'rules': rules_version, 'config': config})
+        if json.loads(payload)['config'] != config:
+            return  # e.g. non-string mapping keys would come back changed
+        # Write then rename so concurrent readers never see a partial file
+        sidecar = _config_sidecar_path(config_path)
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(payload)
+        os.replace(tmp_file, sidecar)
+    except (OSError, TypeError, ValueError):
+        pass  # The cache is only an optimization
+
+
+@lru_cache(maxsize=256)
+def _path_exists(path: str) -> bool:
+    """Check whether a configured tool path exists (memoized; call cache_clear() to re-probe)."""
+    return Path(path).exists()
 
 
 class ConfigValidationError(Exception):
@@ -13,7 +84,53 @@ class ConfigValidationError(Exception):
     pass
 
 
-@dataclass
+class _TrustedConfig(dict):
+    """
+    Config dict already known to be valid, so validation can skip it.
+    
+    Any top-level mutation drops the trust flag. Nested values are not
+    tracked: callers that edit a list or dict in place must validate a copy.
+    """
+    __slots__ = ('_trusted',)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._trusted = True
+    
+    def _mutated(method):
+        def wrapper(self, *args, **kwargs):
+            self._trusted = False
+            return method(self, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        return wrapper
+    
+    __setitem__ = _mutated(dict.__setitem__)
+    __delitem__ = _mutated(dict.__delitem__)
+    if hasattr(dict, '__ior__'):  # Python 3.9+
+        __ior__ = _mutated(dict.__ior__)
+    clear = _mutated(dict.clear)
+    pop = _mutated(dict.pop)
+    popitem = _mutated(dict.popitem)
+    setdefault = _mutated(dict.setdefault)
+    update = _mutated(dict.update)
+    del _mutated
+    
+    def __reduce__(self):
+        # Copies and pickles are plain dicts: trust does not survive leaving this object
+        return (dict, (dict(self),))
+
+
+# Dump trusted configs as ordinary mappings rather than tagged Python objects
+yaml.add_representer(_TrustedConfig, yaml.representer.SafeRepresenter.represent_dict)
+yaml.add_representer(_TrustedConfig, yaml.representer.SafeRepresenter.represent_dict,
+                     Dumper=yaml.SafeDumper)
+
+
+# Slotted dataclasses need Python 3.10+; older versions keep the regular __dict__ layout
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationRule:
     """Configuration validation rule."""
     field: str
@@ -24,13 +141,41 @@ class ValidationRule:
     max_length: Optional[int] = None
     custom_validator: Optional[callable] = None
     description: str = ""
+    _allowed_set: Optional[frozenset] = dataclass_field(default=None, init=False, repr=False, compare=False)
+    _type_names: Optional[str] = dataclass_field(default=None, init=False, repr=False, compare=False)
+    _allowed_str: Optional[str] = dataclass_field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Interned so config key lookups can match on identity first
+        self.field = sys.intern(self.field)
+        
+        # Message fragments are static, so build them once per rule
+        if isinstance(self.field_type, tuple):
+            self._type_names = ' or '.join(t.__name__ for t in self.field_type)
+        elif self.field_type is not None:
+            self._type_names = self.field_type.__name__
+        
+        # Hash lookup for membership; allowed_values stays as given for docs and messages
+        if self.allowed_values is not None:
+            self._allowed_str = ', '.join(str(v) for v in self.allowed_values)
+            try:
+                self._allowed_set = frozenset(self.allowed_values)
+            except TypeError:
+                self._allowed_set = None  # Unhashable values: fall back to the list
+    
+    def check_type(self, value: Any) -> Optional[str]:
+        """Return the type error message for value, or None if it has an accepted type."""
+        # isinstance takes a type or a tuple alike and the names are precomputed, so no shape branch
+        if isinstance(value, self.field_type):
+            return None
+        return f"Field '{self.field}' must be of type {self._type_names}, got {type(value).__name__}"
 
 
 class ConfigValidator:
     """Validates SimTool project configuration."""
     
     # Define validation rules
-    VALIDATION_RULES = [
+    VALIDATION_RULES = (
         ValidationRule(
             field='default_simulator',
             required=True,
@@ -80,17 +225,17 @@ class ConfigValidator:
             field='verilator_path',
             required=False,
             field_type=(str, type(None)),
-            custom_validator=lambda x: x is None or Path(x).exists(),
+            custom_validator=lambda x: x is None or _path_exists(x),
             description="Path to Verilator executable"
         ),
         ValidationRule(
             field='gtkwave_path',
             required=False,
             field_type=(str, type(None)),
-            custom_validator=lambda x: x is None or Path(x).exists(),
+            custom_validator=lambda x: x is None or _path_exists(x),
             description="Path to GTKWave executable"
         ),
-    ]
+    )
     
     @classmethod
     def validate_config(cls, config: Dict[str, Any]) -> None:
@@ -103,76 +248,147 @@ class ConfigValidator:
         Raises:
             ConfigValidationError: If validation fails
         """
+        # Untouched default or already-validated configs need no re-check
+        if type(config) is _TrustedConfig and config._trusted:
+            return
+        
         errors = []
         
-        for rule in cls.VALIDATION_RULES:
-            try:
-                cls._validate_field(config, rule)
-            except ConfigValidationError as e:
-                errors.append(str(e))
+        for check in cls._get_compiled_checks():
+            check(config, errors)
         
         if errors:
             error_msg = "Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
             raise ConfigValidationError(error_msg)
     
     @classmethod
-    def _validate_field(cls, config: Dict[str, Any], rule: ValidationRule) -> None:
-        """Validate a single configuration field."""
-        field_name = rule.field
+    def validate_configs(cls, configs: List[Dict[str, Any]]) -> List[List[str]]:
+        """
+        Validate many configuration dictionaries in one pass.
         
-        # Check if required field is present
-        if rule.required and field_name not in config:
-            raise ConfigValidationError(f"Required field '{field_name}' is missing")
+        Each rule runs across every config before the next rule is fetched,
+        so per-rule setup is paid once rather than once per config.
         
-        # Skip validation if field is not present and not required
-        if field_name not in config:
-            return
+        Args:
+            configs: Configuration dictionaries to validate
             
-        value = config[field_name]
+        Returns:
+            One list of error messages per config (empty when it is valid)
+        """
+        results = [[] for _ in configs]
+        pending = [(config, errors) for config, errors in zip(configs, results)
+                   if not (type(config) is _TrustedConfig and config._trusted)]
+        
+        for check in cls._get_compiled_checks():
+            for config, errors in pending:
+                check(config, errors)
+        
+        return results
+    
+    @classmethod
+    def _rules_version(cls) -> str:
+        """Fingerprint of the validation rules, so cached configs expire when the rules change."""
+        rules = [(rule.field, rule.required, rule._type_names, rule._allowed_str,
+                  rule.min_length, rule.max_length, rule.custom_validator is not None)
+                 for rule in cls.VALIDATION_RULES]
+        return hashlib.blake2b(repr(rules).encode(), digest_size=8).hexdigest()
+    
+    @classmethod
+    def _get_compiled_checks(cls) -> List[Callable[[Dict[str, Any], List[str]], None]]:
+        """Get the per-rule check functions, compiling them when the rules change."""
+        rules = cls.VALIDATION_RULES
+        compiled = cls.__dict__.get('_compiled_checks')
+        if compiled is None or compiled[0] is not rules or compiled[1] != len(rules):
+            compiled = (rules, len(rules), [cls._compile_rule(rule) for rule in rules])
+            cls._compiled_checks = compiled
+        return compiled[2]
+    
+    @classmethod
+    def _validate_field(cls, config: Dict[str, Any], rule: ValidationRule, errors: List[str]) -> None:
+        """Validate a single configuration field, appending any error message to errors."""
+        cls._compile_rule(rule)(config, errors)
+    
+    @staticmethod
+    def _compile_rule(rule: ValidationRule) -> Callable[[Dict[str, Any], List[str]], None]:
+        """
+        Specialize a rule into a check function.
+        
+        Only the checks the rule actually configures are bound; their static
+        message fragments come precomputed from the rule. Each value check
+        returns an error message or None, and the first failure is appended
+        to the caller's error list.
+        """
+        field_name = rule.field
+        required = rule.required
+        value_checks = []
         
         # Type validation
         if rule.field_type is not None:
-            if isinstance(rule.field_type, tuple):
-                # Multiple allowed types
-                if not isinstance(value, rule.field_type):
-                    type_names = ' or '.join(t.__name__ for t in rule.field_type)
-                    raise ConfigValidationError(
-                        f"Field '{field_name}' must be of type {type_names}, got {type(value).__name__}"
-                    )
-            else:
-                # Single type
-                if not isinstance(value, rule.field_type):
-                    raise ConfigValidationError(
-                        f"Field '{field_name}' must be of type {rule.field_type.__name__}, got {type(value).__name__}"
-                    )
+            value_checks.append(rule.check_type)
         
         # Value validation
-        if rule.allowed_values is not None and value not in rule.allowed_values:
-            allowed_str = ', '.join(str(v) for v in rule.allowed_values)
-            raise ConfigValidationError(
-                f"Field '{field_name}' must be one of [{allowed_str}], got '{value}'"
-            )
-        
-        # Length validation for lists/strings
-        if rule.min_length is not None and hasattr(value, '__len__'):
-            if len(value) < rule.min_length:
-                raise ConfigValidationError(
-                    f"Field '{field_name}' must have at least {rule.min_length} items, got {len(value)}"
-                )
+        if rule.allowed_values is not None:
+            allowed_values = rule.allowed_values
+            allowed_lookup = rule._allowed_set if rule._allowed_set is not None else allowed_values
+            allowed_str = rule._allowed_str
+            
+            def check_allowed(value):
+                try:
+                    allowed = value in allowed_lookup
+                except TypeError:
+                    allowed = value in allowed_values  # Unhashable value
+                if not allowed:
+                    return f"Field '{field_name}' must be one of [{allowed_str}], got '{value}'"
+                return None
+            value_checks.append(check_allowed)
         
-        if rule.max_length is not None and hasattr(value, '__len__'):
-            if len(value) > rule.max_length:
-                raise ConfigValidationError(
-                    f"Field '{field_name}' must have at most {rule.max_length} items, got {len(value)}"
-                )
+        # Length validation for lists/strings (one probe covers both bounds)
+        if rule.min_length is not None or rule.max_length is not None:
+            min_length = rule.min_length
+            max_length = rule.max_length
+            
+            def check_length(value):
+                if not hasattr(value, '__len__'):
+                    return None
+                length = len(value)
+                if min_length is not None and length < min_length:
+                    return f"Field '{field_name}' must have at least {min_length} items, got {length}"
+                if max_length is not None and length > max_length:
+                    return f"Field '{field_name}' must have at most {max_length} items, got {length}"
+                return None
+            value_checks.append(check_length)
         
-        # Custom validation
+        # Custom validation (last: it may touch the filesystem)
         if rule.custom_validator is not None:
-            try:
-                if not rule.custom_validator(value):
-                    raise ConfigValidationError(f"Field '{field_name}' failed custom validation")
-            except Exception as e:
-                raise ConfigValidationError(f"Field '{field_name}' validation error: {e}")
+            custom_validator = rule.custom_validator
+            
+            # Same wording the earlier raise-and-wrap version produced
+            failed_msg = f"Field '{field_name}' validation error: Field '{field_name}' failed custom validation"
+            
+            def check_custom(value):
+                try:
+                    if custom_validator(value):
+                        return None
+                except Exception as e:
+                    return f"Field '{field_name}' validation error: {e}"
+                return failed_msg
+            value_checks.append(check_custom)
+        
+        def check(config: Dict[str, Any], errors: List[str]) -> None:
+            # Check if required field is present; skip validation if absent and optional
+            value = config.get(field_name, _MISSING)
+            if value is _MISSING:
+                if required:
+                    errors.append(f"Required field '{field_name}' is missing")
+                return
+            
+            for value_check in value_checks:
+                error = value_check(value)
+                if error is not None:
+                    errors.append(error)
+                    return
+        
+        return check
     
     @classmethod
     def validate_yaml_file(cls, config_path: Path) -> Dict[str, Any]:
@@ -183,17 +399,47 @@ class ConfigValidator:
             config_path: Path to configuration file
             
         Returns:
-            Validated configuration dictionary
+            Validated configuration dictionary (validate_config skips it until modified)
             
         Raises:
             ConfigValidationError: If file is invalid or validation fails
         """
-        if not config_path.exists():
+        try:
+            cfg_stat = config_path.stat()
+        except FileNotFoundError:
             raise ConfigValidationError(f"Configuration file not found: {config_path}")
+        except OSError as e:
+            raise ConfigValidationError(f"Error reading configuration file: {e}")
+        
+        # Reuse the result while the file is unchanged (callers get their own copy)
+        cache_key = (str(config_path.resolve()), cfg_stat.st_mtime_ns, cfg_stat.st_size)
+        cached = _YAML_CACHE.get(cache_key)
+        if cached is not None:
+            _YAML_CACHE.move_to_end(cache_key)
+            return _TrustedConfig(copy.deepcopy(cached))
         
+        # A JSON cache from an earlier run skips YAML parsing (written under the same rules)
+        rules_version = cls._rules_version()
+        config = _read_config_sidecar(config_path, cfg_stat, rules_version)
+        if config is None:
+            config = cls._parse_and_validate(config_path)
+            _write_config_sidecar(config_path, cfg_stat, rules_version, config)
+        else:
+            # Still validated: checks such as tool paths depend on state outside the file
+            cls.validate_config(config)
+        
+        _YAML_CACHE[cache_key] = copy.deepcopy(config)
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+        # Marked validated so callers re-checking it pay nothing until they modify it
+        return _TrustedConfig(config)
+    
+    @classmethod
+    def _parse_and_validate(cls, config_path: Path) -> Dict[str, Any]:
+        """Parse a YAML configuration file and validate its contents."""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            # One read into a contiguous buffer; the loader detects the encoding itself
+            config = yaml.load(config_path.read_bytes(), Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise ConfigValidationError(f"Invalid YAML in configuration file: {e}")
         except Exception as e:
@@ -213,37 +459,35 @@ class ConfigValidator:
     @classmethod
     def generate_schema_documentation(cls) -> str:
         """Generate documentation for configuration schema."""
-        doc = "SimTool Configuration Schema\n"
-        doc += "=" * 30 + "\n\n"
+        parts = ["SimTool Configuration Schema\n", "=" * 30, "\n\n"]
         
         for rule in cls.VALIDATION_RULES:
-            doc += f"**{rule.field}**"
+            parts.append(f"**{rule.field}**")
             if rule.required:
-                doc += " (required)"
-            doc += "\n"
+                parts.append(" (required)")
+            parts.append("\n")
             
             if rule.field_type:
                 if isinstance(rule.field_type, tuple):
                     type_names = ' | '.join(t.__name__ for t in rule.field_type)
-                    doc += f"  Type: {type_names}\n"
+                    parts.append(f"  Type: {type_names}\n")
                 else:
-                    doc += f"  Type: {rule.field_type.__name__}\n"
+                    parts.append(f"  Type: {rule._type_names}\n")
             
             if rule.allowed_values:
-                allowed_str = ', '.join(str(v) for v in rule.allowed_values)
-                doc += f"  Allowed values: {allowed_str}\n"
+                parts.append(f"  Allowed values: {rule._allowed_str}\n")
             
             if rule.description:
-                doc += f"  Description: {rule.description}\n"
+                parts.append(f"  Description: {rule.description}\n")
             
-            doc += "\n"
+            parts.append("\n")
         
-        return doc
+        return "".join(parts)
 
 
 def create_default_config() -> Dict[str, Any]:
-    """Create a default configuration dictionary."""
-    return {
+    """Create a default configuration dictionary (trusted by validate_config until modified)."""
+    return _TrustedConfig({
         'default_simulator': 'verilator',
         'default_waves': True,
         'rtl_paths': ['rtl'],
@@ -254,4 +498,4 @@ def create_default_config() -> Dict[str, Any]:
         'systemc_path': None,
         'gtkwave_path': None,
         'verilator_path': None
-    }
\ No newline at end of file
+    })
\ No newline at end of file
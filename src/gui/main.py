@@ -7,24 +7,107 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import sys
 import os
+import re
+import queue
 import subprocess
 import threading
 from pathlib import Path
 import yaml
 import json
+import copy
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 
+try:
+    # libyaml-backed loader/dumper are much faster when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 # Simple constants
 DEFAULT_RTL_DIR = "rtl"
 DEFAULT_TB_DIR = "tb"
 DEFAULT_BUILD_DIR = "work"
 DEFAULT_CONFIG_FILE = "simtool.cfg"
 
+# File type by lowercase extension (anything else is 'file')
+_EXT_TO_TYPE = {
+    '.sv': 'rtl',
+    '.v': 'rtl',
+    '.py': 'python',
+    '.cpp': 'cpp',
+    '.c': 'cpp',
+    '.cfg': 'config',
+}
+
+# Module/interface declarations at the start of a line, in one pass over the text
+_MODULE_DECL_RE = re.compile(r'^\s*(?:module|interface)\s+(\w+)', re.IGNORECASE | re.MULTILINE)
+
+
+def _read_source(path) -> str:
+    """Read a whole source file with one read(), ignoring undecodable bytes."""
+    # Unbuffered fd read skips the buffered-reader setup (tty probe, seeks) of open()
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size + 1)]
+        while chunks[-1]:  # Read on until EOF in case the file grew since fstat
+            chunks.append(os.read(fd, 65536))
+        return b''.join(chunks).decode('utf-8', 'ignore')
+    finally:
+        os.close(fd)
+
+
+# Parsed project configs keyed by (path, mtime_ns, size), least recently used first
+_CFG_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_CFG_CACHE_SIZE = 16
+
+# Console message tags, each colored with the design color of the same name
+_CONSOLE_TAGS = ('success', 'error', 'warning', 'info')
+
+# File checkboxes created per idle tick while populating the panel
+_CHECKBOX_CHUNK = 100
+
+# Interval at which the Tk thread picks up finished background file scans
+_SCAN_POLL_MS = 50
+
+# Project directories shown in the file selection panel, with their headings
+_FILE_SECTIONS = (('rtl', 'RTL Files'), ('tb', 'Testbench Files'))
+
+# Simulator output directories that never hold user sources
+_BUILD_DIR_NAMES = frozenset(('sim_build', DEFAULT_BUILD_DIR))
+
+
+def _safe_scandir(path):
+    """Yield the entries of a directory, or nothing if it is missing, not a directory or unreadable."""
+    # Attempting the listing replaces separate exists()/is_dir() probes
+    try:
+        it = os.scandir(path)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+    with it:
+        yield from it
+
+
+def _iter_source_files(root):
+    """Yield files below root in one walk, pruning simulator build directories."""
+    # DirEntry type checks use the d_type from the listing, so most entries need no stat
+    for entry in _safe_scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in _BUILD_DIR_NAMES:
+                yield from _iter_source_files(entry.path)
+        elif entry.is_file():
+            yield Path(entry.path)
+
+
+# Delay that coalesces back-to-back preference writes
+_PREFS_SAVE_DELAY_MS = 500
+
 
 class PreferencesManager:
     """Manage user preferences for SimTool GUI."""
     
-    def __init__(self):
+    def __init__(self, root=None):
         self.prefs_file = Path.home() / ".simtool_preferences.json"
         self.defaults = {
             "default_simulator": "verilator",
@@ -45,6 +128,11 @@ class PreferencesManager:
             "last_top_modules": {},     # project_path -> top_module
         }
         self.preferences = self._load_preferences()
+        # Existence of recent project paths, checked once per session
+        self._recent_exists_cache: Dict[str, bool] = {}
+        # Tk widget used to debounce writes (without one, saves happen immediately)
+        self._root = root
+        self._save_timer = None
     
     def _load_preferences(self) -> dict:
         """Load preferences from file."""
@@ -63,12 +151,23 @@ class PreferencesManager:
     
     def save_preferences(self):
         """Save preferences to file."""
+        # Writing now supersedes any scheduled save
+        if self._save_timer is not None:
+            self._root.after_cancel(self._save_timer)
+            self._save_timer = None
         try:
             with open(self.prefs_file, 'w') as f:
-                json.dump(self.preferences, f, indent=2)
+                json.dump(self.preferences, f, separators=(',', ':'))
         except Exception as e:
             pass  # Silently fail to save preferences
     
+    def schedule_save(self):
+        """Save preferences shortly, folding rapid successive changes into one write."""
+        if self._root is None:
+            self.save_preferences()
+        elif self._save_timer is None:
+            self._save_timer = self._root.after(_PREFS_SAVE_DELAY_MS, self.save_preferences)
+    
     def get(self, key: str, default=None):
         """Get preference value."""
         return self.preferences.get(key, default)
@@ -85,7 +184,8 @@ class PreferencesManager:
         recent.insert(0, project_path)
         # Keep only max_recent_projects items
         self.preferences["recent_projects"] = recent[:self.preferences["max_recent_projects"]]
-        self.save_preferences()
+        self._recent_exists_cache.pop(project_path, None)
+        self.schedule_save()
     
     def save_project_state(self, project_path: str, selected_files: list, top_module: str, sim_time: str = None):
         """Save project-specific state."""
@@ -107,11 +207,19 @@ class PreferencesManager:
     
     def get_recent_projects(self) -> list:
         """Get list of recent projects that still exist."""
+        cache = self._recent_exists_cache
         recent = []
         for path in self.preferences["recent_projects"]:
-            if Path(path).exists():
+            exists = cache.get(path)
+            if exists is None:
+                exists = cache[path] = os.path.exists(path)
+            if exists:
                 recent.append(path)
         return recent
+    
+    def invalidate_recent_cache(self):
+        """Forget cached recent project existence so the next lookup re-checks the disk."""
+        self._recent_exists_cache.clear()
 
 
 class SimpleProject:
@@ -124,13 +232,26 @@ class SimpleProject:
     def _load_config(self) -> Dict[str, Any]:
         """Load project configuration."""
         config_file = self.project_path / DEFAULT_CONFIG_FILE
-        if config_file.exists():
+        try:
+            st = config_file.stat()
+        except OSError:
+            return self._get_default_config()
+        
+        # Reopening an unchanged project costs one stat instead of a YAML parse
+        key = (str(config_file), st.st_mtime_ns, st.st_size)
+        cached = _CFG_CACHE.get(key)
+        if cached is None:
             try:
                 with open(config_file, 'r') as f:
-                    return yaml.safe_load(f) or {}
+                    cached = yaml.load(f, Loader=_YamlLoader) or {}
             except Exception:
-                pass
-        return self._get_default_config()
+                return self._get_default_config()
+            _CFG_CACHE[key] = cached
+            if len(_CFG_CACHE) > _CFG_CACHE_SIZE:
+                _CFG_CACHE.popitem(last=False)
+        else:
+            _CFG_CACHE.move_to_end(key)
+        return copy.deepcopy(cached)
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration."""
@@ -145,22 +266,25 @@ class SimpleProject:
     def get_rtl_files(self) -> List[Path]:
         """Get RTL files in project."""
         files = []
+        exts = ('.sv', '.v')
         for path_str in self.config.get('rtl_paths', ['rtl']):
             rtl_path = self.project_path / path_str
-            if rtl_path.exists():
-                files.extend(rtl_path.glob('*.sv'))
-                files.extend(rtl_path.glob('*.v'))
+            files.extend(Path(entry.path) for entry in _safe_scandir(rtl_path)
+                         if os.path.splitext(entry.name)[1] in exts)
         return files
     
     def get_tb_files(self) -> List[Path]:
         """Get testbench files."""
         files = []
+        exts = {'.py', '.sv', '.cpp'}
         for path_str in self.config.get('tb_paths', ['tb']):
             tb_path = self.project_path / path_str
-            if tb_path.exists():
-                files.extend(tb_path.rglob('*.py'))
-                files.extend(tb_path.rglob('*.sv'))
-                files.extend(tb_path.rglob('*.cpp'))
+            # One walk dispatching on suffix instead of an rglob per extension
+            for dirpath, dirnames, filenames in os.walk(tb_path):
+                # Simulator build directories hold generated copies, not testbenches
+                dirnames[:] = [d for d in dirnames if d not in _BUILD_DIR_NAMES]
+                files.extend(Path(dirpath) / name for name in filenames
+                             if os.path.splitext(name)[1] in exts)
         return files
 
 
@@ -423,7 +547,7 @@ class SimToolGUIStandalone:
         self._set_window_icon()
         
         # Initialize preferences
-        self.preferences = PreferencesManager()
+        self.preferences = PreferencesManager(self.root)
         
         # Set window geometry from preferences
         geometry = self.preferences.get("window_geometry", "1200x800")
@@ -437,8 +561,16 @@ class SimToolGUIStandalone:
         self.file_checkboxes = {}
         self.current_process = None  # Track running processes
         self.has_unsaved_changes = False  # Track unsaved project state
+        self._scan_generation = 0  # Bumped per file scan so stale results are dropped
+        self._module_files = ([], [])  # (rtl_files, tb_files) from the configured paths at the last scan
+        self._scan_results = queue.Queue()  # Finished background scans, drained on the Tk thread
+        # One Tcl command shared by every file checkbox; the file path is passed as its argument
+        self._checkbox_toggle_cmd = self.root.register(self._on_checkbox_command)
+        self._console_tag_colors = None  # Console tag colors last pushed to Tk
         
         self._create_gui()
+        # Scan threads never touch Tk; their results are collected here once mainloop runs
+        self.root.after(_SCAN_POLL_MS, self._poll_scan_results)
         self._try_load_project()
     
     def _create_gui(self):
@@ -518,18 +650,12 @@ class SimToolGUIStandalone:
         file_menu.add_separator()
         file_menu.add_command(label="Save Project State", command=self._save_project_state, accelerator="Ctrl+S")
         
-        # Recent projects submenu
-        recent_projects = self.preferences.get_recent_projects()
-        if recent_projects:
-            file_menu.add_separator()
-            recent_menu = tk.Menu(file_menu, tearoff=0)
-            file_menu.add_cascade(label="Recent Projects", menu=recent_menu)
-            for project_path in recent_projects[:5]:  # Show up to 5 recent
-                project_name = Path(project_path).name
-                recent_menu.add_command(
-                    label=project_name,
-                    command=lambda p=project_path: self._load_project(Path(p))
-                )
+        # Recent projects submenu (kept so it can be refilled without rebuilding the menu bar)
+        file_menu.add_separator()
+        self._file_menu = file_menu
+        self._recent_menu = tk.Menu(file_menu, tearoff=0)
+        file_menu.add_cascade(label="Recent Projects", menu=self._recent_menu)
+        self._refresh_recent_submenu()
         
         file_menu.add_separator()
         file_menu.add_command(label="Preferences...", command=self._show_preferences)
@@ -1082,11 +1208,12 @@ class SimToolGUIStandalone:
                 selectforeground='white'
             )
             
-            # Update console tag colors
-            self.console_text.tag_config('success', foreground=self.design.get_color('success'))
-            self.console_text.tag_config('error', foreground=self.design.get_color('error'))
-            self.console_text.tag_config('warning', foreground=self.design.get_color('warning'))
-            self.console_text.tag_config('info', foreground=self.design.get_color('info'))
+            # Update console tag colors (skipped when the last applied colors still hold)
+            tag_colors = tuple((tag, self.design.get_color(tag)) for tag in _CONSOLE_TAGS)
+            if tag_colors != self._console_tag_colors:
+                for tag, color in tag_colors:
+                    self.console_text.tag_config(tag, foreground=color)
+                self._console_tag_colors = tag_colors
         
         # Apply status bar styling
         if hasattr(self, 'status_frame'):
@@ -1371,16 +1498,10 @@ class SimToolGUIStandalone:
             # Add to recent projects
             self.preferences.add_recent_project(str(project_path))
             
-            self._refresh_file_selection()
-            self._update_modules()
-            
-            # Restore previous selections
-            self._restore_project_state()
-            
-            # Update top modules based on any restored file selections
-            self._update_top_modules_from_selected_files()
+            # Selections are restored once the background scan has built the checkboxes
+            self._refresh_file_selection(on_scanned=self._on_project_files_scanned)
             
-            # Mark as saved (freshly loaded project has no unsaved changes)
+            # Mark as saved while scanning (reset again once the saved state is restored)
             self.has_unsaved_changes = False
             self._update_window_title()
             
@@ -1416,7 +1537,7 @@ class SimToolGUIStandalone:
                 
                 config_file = project_path / DEFAULT_CONFIG_FILE
                 with open(config_file, 'w') as f:
-                    yaml.dump(config, f, default_flow_style=False)
+                    yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False)
                 
                 # Load the new project
                 self._load_project(project_path)
@@ -1435,17 +1556,39 @@ class SimToolGUIStandalone:
             self.root.geometry(geometry)
             
             # Refresh menu to show recent projects
-            self._refresh_menu()
+            self.preferences.invalidate_recent_cache()
+            self._refresh_recent_submenu()
     
-    def _refresh_menu(self):
-        """Refresh the menu bar."""
-        # Clear current menu
-        self.root.config(menu="")
-        # Recreate menu
-        self._create_menu()
+    def _refresh_recent_submenu(self):
+        """Refill the Recent Projects submenu in place."""
+        self._recent_menu.delete(0, tk.END)
+        recent_projects = self.preferences.get_recent_projects()
+        for project_path in recent_projects[:5]:  # Show up to 5 recent
+            project_name = Path(project_path).name
+            self._recent_menu.add_command(
+                label=project_name,
+                command=lambda p=project_path: self._load_project(Path(p))
+            )
+        # Keep the entry in place but greyed out when there is nothing to show
+        self._file_menu.entryconfigure("Recent Projects",
+                                       state=tk.NORMAL if recent_projects else tk.DISABLED)
+    
+    def _on_project_files_scanned(self):
+        """Fill the module list and restore saved selections once the project's files are scanned."""
+        self._update_modules()
+        
+        # Restore previous selections
+        self._restore_project_state()
+        
+        # Update top modules based on any restored file selections
+        self._update_top_modules_from_selected_files()
+        
+        # Restoring fires the top module/sim time traces; a freshly loaded project is still saved
+        self.has_unsaved_changes = False
+        self._update_window_title()
     
-    def _refresh_file_selection(self):
-        """Refresh the file selection panel."""
+    def _refresh_file_selection(self, on_scanned=None):
+        """Refresh the file selection panel, scanning project files in the background."""
         if not self.project:
             return
         
@@ -1455,11 +1598,81 @@ class SimToolGUIStandalone:
         self.file_checkboxes.clear()
         self.selected_files.clear()
         
-        # Create file selection section
-        self._create_file_selection_section()
-        
         # Update selection count
         self._update_selection_count()
+        
+        ttk.Label(self.file_selection_frame, text="Scanning…").pack(anchor=tk.W, padx=5, pady=10)
+        
+        # Walk the tree off the Tk thread; widgets are still created on the main thread
+        self._scan_generation += 1
+        threading.Thread(target=self._scan_files_bg,
+                         args=(self.project, self._scan_generation, on_scanned),
+                         daemon=True).start()
+    
+    def _scan_files_bg(self, project: SimpleProject, generation: int, on_scanned=None):
+        """Collect the panel's (file_path, type, section, label) tuples and the module sources, and queue them for the Tk thread."""
+        project_path = project.project_path
+        data = []
+        for dir_name, dir_label in _FILE_SECTIONS:
+            compatible_files = []
+            try:
+                for file_path in _iter_source_files(project_path / dir_name):
+                    file_type = self._get_file_type(file_path)
+                    # Only include compileable files
+                    if file_type in ('rtl', 'python', 'cpp'):
+                        compatible_files.append((file_path, file_type))
+            except OSError:
+                continue  # I/O error mid-walk (missing or unreadable directories yield nothing)
+            
+            # Sort only the sources, not every file the walk visited
+            compatible_files.sort()
+            data.extend((file_path, file_type, dir_name, dir_label)
+                        for file_path, file_type in compatible_files)
+        
+        # Module discovery follows the project's configured rtl_paths/tb_paths
+        module_files = (project.get_rtl_files(), project.get_tb_files())
+        
+        self._scan_results.put((generation, data, module_files, on_scanned))
+    
+    def _poll_scan_results(self):
+        """Build the widgets for any finished background scans, then poll again."""
+        try:
+            while True:
+                try:
+                    generation, data, module_files, on_scanned = self._scan_results.get_nowait()
+                except queue.Empty:
+                    break
+                if generation == self._scan_generation:
+                    self._module_files = module_files
+                self._build_checkbox_widgets(generation, data, on_scanned)
+        finally:
+            self.root.after(_SCAN_POLL_MS, self._poll_scan_results)
+    
+    def _build_checkbox_widgets(self, generation: int, data: list, on_scanned=None, start: int = 0):
+        """Replace the scanning placeholder with checkboxes, a chunk per idle tick."""
+        # A newer refresh started while this scan was running
+        if generation != self._scan_generation:
+            return
+        
+        if start == 0:
+            for widget in self.file_selection_frame.winfo_children():
+                widget.destroy()
+            
+            # Create file selection section
+            self._create_file_selection_section()
+        
+        # Bounded work per tick so Tk can repaint and handle input between chunks
+        end = min(start + _CHECKBOX_CHUNK, len(data))
+        for i in range(start, end):
+            file_path, file_type, dir_name, dir_label = data[i]
+            # Files arrive grouped by directory; start a section at each new one
+            new_section = dir_label if i == 0 or data[i - 1][2] != dir_name else None
+            self._add_file_checkbox(file_path, file_type, dir_name, new_section)
+        
+        if end < len(data):
+            self.root.after_idle(self._build_checkbox_widgets, generation, data, on_scanned, end)
+        elif on_scanned is not None:
+            on_scanned()
     
     def _create_file_selection_section(self):
         """Create unified file selection section with improved empty state."""
@@ -1554,66 +1767,41 @@ class SimToolGUIStandalone:
                   command=self._select_all_files).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="Clear All", 
                   command=self._clear_all_files).pack(side=tk.LEFT)
-        
-        # Group files by directory
-        for dir_name, dir_label in [('rtl', 'RTL Files'), ('tb', 'Testbench Files')]:
-            dir_path = self.project.project_path / dir_name
-            if not dir_path.exists():
-                continue
-                
-            # Collect compatible files from this directory
-            compatible_files = []
-            try:
-                # First check if directory exists and is accessible
-                if dir_path.exists() and dir_path.is_dir():
-                    for file_path in sorted(dir_path.rglob('*')):
-                        # Verify file actually exists and is a regular file
-                        if file_path.exists() and file_path.is_file():
-                            file_type = self._get_file_type(file_path)
-                            # Only include compileable files
-                            if file_type in ['rtl', 'python', 'cpp']:
-                                compatible_files.append(file_path)
-                else:
-                    # Directory doesn't exist, skip
-                    continue
-            except (PermissionError, OSError) as e:
-                # Log the error but continue
-                pass  # Skip inaccessible directories
-                continue
+    
+    def _add_file_checkbox(self, file_path: Path, file_type: str, dir_name: str, section_label: str = None):
+        """Add one file checkbox, preceded by a section header when section_label is given."""
+        if section_label is not None:
+            # Section header
+            section_frame = ttk.Frame(self.file_selection_frame)
+            section_frame.pack(fill=tk.X, pady=(10, 5))
             
-            # Only create section if there are compatible files
-            if compatible_files:
-                # Section header
-                section_frame = ttk.Frame(self.file_selection_frame)
-                section_frame.pack(fill=tk.X, pady=(10, 5))
-                
-                # Directory label
-                ttk.Label(section_frame, text=dir_label, 
-                         font=('TkDefaultFont', 10, 'bold')).pack(anchor=tk.W, padx=5)
-                
-                
-                # Files in this directory
-                for file_path in compatible_files:
-                    var = tk.BooleanVar()
-                    
-                    file_frame = ttk.Frame(self.file_selection_frame)
-                    file_frame.pack(fill=tk.X, padx=20, pady=1)
-                    
-                    checkbox = ttk.Checkbutton(
-                        file_frame, 
-                        text=file_path.name,
-                        variable=var,
-                        command=lambda p=file_path, v=var: self._on_checkbox_toggle(p, v)
-                    )
-                    checkbox.pack(side=tk.LEFT)
-                    
-                    # Store checkbox info
-                    self.file_checkboxes[file_path] = {
-                        'var': var,
-                        'widget': checkbox,
-                        'section': dir_name,
-                        'type': self._get_file_type(file_path)
-                    }
+            # Directory label
+            ttk.Label(section_frame, text=section_label, 
+                     font=('TkDefaultFont', 10, 'bold')).pack(anchor=tk.W, padx=5)
+        
+        var = tk.BooleanVar()
+        
+        # Packed straight into the panel: a wrapper frame per file only adds layout work
+        checkbox = ttk.Checkbutton(
+            self.file_selection_frame, 
+            text=file_path.name,
+            variable=var,
+            command=(self._checkbox_toggle_cmd, str(file_path))
+        )
+        checkbox.pack(anchor=tk.W, padx=20, pady=1)
+        
+        # Store checkbox info
+        self.file_checkboxes[file_path] = {
+            'var': var,
+            'widget': checkbox,
+            'section': dir_name,
+            'type': file_type
+        }
+    
+    def _on_checkbox_command(self, path_str: str):
+        """Dispatch a file checkbox click from the shared Tcl command."""
+        file_path = Path(path_str)
+        self._on_checkbox_toggle(file_path, self.file_checkboxes[file_path]['var'])
     
     def _on_checkbox_toggle(self, file_path: Path, var: tk.BooleanVar):
         """Handle checkbox toggle."""
@@ -1749,17 +1937,7 @@ class SimToolGUIStandalone:
     
     def _get_file_type(self, file_path: Path) -> str:
         """Get file type from extension."""
-        suffix = file_path.suffix.lower()
-        if suffix in ['.sv', '.v']:
-            return 'rtl'
-        elif suffix == '.py':
-            return 'python'
-        elif suffix in ['.cpp', '.c']:
-            return 'cpp'
-        elif suffix == '.cfg':
-            return 'config'
-        else:
-            return 'file'
+        return _EXT_TO_TYPE.get(file_path.suffix.lower(), 'file')
     
     def _update_modules(self):
         """Update top module dropdown with RTL and testbench modules from ALL project files."""
@@ -1769,30 +1947,27 @@ class SimToolGUIStandalone:
         rtl_modules = []
         tb_modules = []
         
-        # Extract modules from RTL files
-        try:
-            rtl_files = self.project.get_rtl_files()
-            for file_path in rtl_files:
-                rtl_modules.extend(self._extract_modules_from_file(file_path))
-        except:
-            pass
+        # Testbench extractors by file type
+        extractors = {
+            'rtl': self._extract_modules_from_file,  # SystemVerilog testbenches
+            'python': self._extract_python_modules,  # Python testbenches
+            'cpp': self._extract_cpp_modules,        # C++ testbenches
+        }
         
-        # Extract modules from testbench files
-        try:
-            tb_files = self.project.get_tb_files()
-            for file_path in tb_files:
-                # Skip build directories
-                if 'sim_build' in str(file_path):
-                    continue
-                    
-                if file_path.suffix.lower() in ['.sv', '.v']:  # SystemVerilog testbenches
-                    tb_modules.extend(self._extract_modules_from_file(file_path))
-                elif file_path.suffix.lower() == '.py':  # Python testbenches  
-                    tb_modules.extend(self._extract_python_modules(file_path))
-                elif file_path.suffix.lower() == '.cpp':  # C++ testbenches
-                    tb_modules.extend(self._extract_cpp_modules(file_path))
-        except Exception as e:
-            self._log_message(f"Error loading testbench modules: {e}", "error")
+        # Parse each file from the last scan once, even if rtl_paths and tb_paths overlap
+        parsed = {}
+        rtl_files, tb_files = self._module_files
+        for file_path in rtl_files:
+            if file_path not in parsed:
+                parsed[file_path] = self._extract_modules_from_file(file_path)
+            rtl_modules.extend(parsed[file_path])
+        for file_path in tb_files:
+            extract = extractors.get(self._get_file_type(file_path))
+            if extract is None:
+                continue
+            if file_path not in parsed:
+                parsed[file_path] = extract(file_path)
+            tb_modules.extend(parsed[file_path])
         
         # Combine all modules with indicators
         all_modules = []
@@ -1883,45 +2058,34 @@ class SimToolGUIStandalone:
     
     def _extract_modules_from_file(self, file_path: Path) -> list:
         """Extract module names from SystemVerilog/Verilog file."""
-        modules = []
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                import re
-                # Match module declarations only (not inside comments or strings)
-                # Look for "module" at beginning of line or after whitespace
-                matches = re.findall(r'^\s*module\s+(\w+)', content, re.IGNORECASE | re.MULTILINE)
-                modules.extend(matches)
-                # Also look for interface declarations
-                interface_matches = re.findall(r'^\s*interface\s+(\w+)', content, re.IGNORECASE | re.MULTILINE)
-                modules.extend(interface_matches)
-        except Exception as e:
-            pass
-        return modules
+            content = _read_source(file_path)
+        except Exception:
+            return []
+        # Module and interface declarations at the beginning of a line
+        return _MODULE_DECL_RE.findall(content)
     
     def _extract_python_modules(self, file_path: Path) -> list:
         """Extract module names from Python testbench files."""
         modules = []
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                import re
-                # Look for cocotb test decorators and dut instantiation
-                if 'import cocotb' in content:
-                    # Look for dut = or similar patterns
-                    dut_matches = re.findall(r'dut\s*=.*?(\w+)\s*\(', content)
-                    modules.extend(dut_matches)
-                    
-                    # Look for explicit DUT specification in comments
-                    comment_matches = re.findall(r'#.*?(?:dut|module|top).*?[:\s](\w+)', content, re.IGNORECASE)
-                    modules.extend(comment_matches)
-                    
-                    # Use filename as module name if no explicit DUT found
-                    if not modules:
-                        name = file_path.stem
-                        if name.startswith('test_'):
-                            module_name = name[5:]  # Remove 'test_' prefix
-                            modules.append(module_name)
+            content = _read_source(file_path)
+            # Look for cocotb test decorators and dut instantiation
+            if 'import cocotb' in content:
+                # Look for dut = or similar patterns
+                dut_matches = re.findall(r'dut\s*=.*?(\w+)\s*\(', content)
+                modules.extend(dut_matches)
+                
+                # Look for explicit DUT specification in comments
+                comment_matches = re.findall(r'#.*?(?:dut|module|top).*?[:\s](\w+)', content, re.IGNORECASE)
+                modules.extend(comment_matches)
+                
+                # Use filename as module name if no explicit DUT found
+                if not modules:
+                    name = file_path.stem
+                    if name.startswith('test_'):
+                        module_name = name[5:]  # Remove 'test_' prefix
+                        modules.append(module_name)
         except:
             pass
         return modules
@@ -1930,24 +2094,22 @@ class SimToolGUIStandalone:
         """Extract top-level names from C++ testbench files."""
         modules = []
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                import re
-                # Look for Verilator top module instantiations
-                v_matches = re.findall(r'V(\w+)\s*\*?\s*\w+', content)
-                modules.extend(v_matches)
-                
-                # Look for cocotb testbench patterns
-                cocotb_matches = re.findall(r'dut\s*=\s*[\w\.]*(\w+)\(', content)
-                modules.extend(cocotb_matches)
-                
-                # Look for explicit module names in comments or defines
-                comment_matches = re.findall(r'//.*module[:\s]*(\w+)', content, re.IGNORECASE)
-                modules.extend(comment_matches)
-                
-                # Look for #include patterns that might indicate module names
-                include_matches = re.findall(r'#include\s*["\']V(\w+)\.h["\']', content)
-                modules.extend(include_matches)
+            content = _read_source(file_path)
+            # Look for Verilator top module instantiations
+            v_matches = re.findall(r'V(\w+)\s*\*?\s*\w+', content)
+            modules.extend(v_matches)
+            
+            # Look for cocotb testbench patterns
+            cocotb_matches = re.findall(r'dut\s*=\s*[\w\.]*(\w+)\(', content)
+            modules.extend(cocotb_matches)
+            
+            # Look for explicit module names in comments or defines
+            comment_matches = re.findall(r'//.*module[:\s]*(\w+)', content, re.IGNORECASE)
+            modules.extend(comment_matches)
+            
+            # Look for #include patterns that might indicate module names
+            include_matches = re.findall(r'#include\s*["\']V(\w+)\.h["\']', content)
+            modules.extend(include_matches)
         except:
             pass
         return modules
@@ -2467,6 +2629,7 @@ Built with Python and tkinter"""
         try:
             self.root.mainloop()
         except KeyboardInterrupt:
+            self.preferences.save_preferences()  # Flush any debounced write
             self.root.quit()
 
 
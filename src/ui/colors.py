@@ -2,11 +2,25 @@
 Colored output utilities for SimTool CLI.
 """
 
-import colorama
-from colorama import Fore, Back, Style
+import sys
 
-# Initialize colorama
-colorama.init(autoreset=True)
+# Only load colorama (and emit escape codes) when writing to a terminal
+_USE_COLOR = bool(getattr(sys.stdout, 'isatty', lambda: False)())
+
+if _USE_COLOR:
+    import colorama
+    from colorama import Fore, Back, Style
+    
+    # Initialize colorama
+    colorama.init(autoreset=True)
+else:
+    class _NoColor:
+        """Stand-in for colorama's Fore/Back/Style that yields empty codes."""
+        
+        def __getattr__(self, name: str) -> str:
+            return ''
+    
+    Fore = Back = Style = _NoColor()
 
 
 class Colors:
@@ -9,6 +9,14 @@ from pathlib import Path
 from typing import Dict, Any
 
 
+@pytest.fixture(autouse=True)
+def user_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep caches written during tests out of the real user cache directory."""
+    cache_dir = tmp_path_factory.mktemp('cache')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
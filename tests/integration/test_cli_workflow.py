@@ -81,4 +81,20 @@ class TestCLIWorkflow:
             assert result.exit_code == 1
             assert 'Project config not found' in result.output
         finally:
-            os.chdir(original_cwd)
\ No newline at end of file
+            os.chdir(original_cwd)    
+    def test_vlog_multiple_tops_uses_compile_many(self, mock_project):
+        """Test that repeated --top options compile through compile_many with the CLI options."""
+        from unittest.mock import patch
+        from src.cli_commands.commands import CompileHandler
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(mock_project)
+            runner = CliRunner()
+            
+            with patch.object(CompileHandler, 'compile_many', return_value=[True, False]) as compile_many:
+                result = runner.invoke(main, ['--verbose', 'vlog', '--top', 'counter', '--top', 'alu', '--no-waves'])
+            
+            assert result.exit_code == 1
+            compile_many.assert_called_once_with([((), 'counter'), ((), 'alu')], None, 'auto', False, True)
+        finally:
+            os.chdir(original_cwd)
@@ -0,0 +1,282 @@
+"""
+Unit tests for CLI command handlers.
+"""
+
+import os
+from unittest.mock import Mock, patch
+from pathlib import Path
+from src.cli_commands.commands import CleanupHandler, CompileHandler, _get_project, _project_for_top
+from src.core.constants import DefaultPaths
+
+# Stand-in for the verilator binary: records the build it was asked for instead of running one
+_VERILATOR_STUB = """#!/bin/sh
+if [ "$1" = "--version" ]; then echo "Verilator 5.000 stub"; exit 0; fi
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --Mdir) mdir=$2; shift ;;
+        --top-module) top=$2; shift ;;
+    esac
+    shift
+done
+echo $PPID > "$mdir/compiled_by"
+touch "$mdir/V$top"
+"""
+
+
+class TestCompileHandler:
+    """Test cases for CompileHandler class."""
+
+    def test_build_key_stable_for_same_inputs(self, mock_project, sample_config):
+        """Test that identical compile inputs produce the same build key."""
+        handler = CompileHandler()
+        rtl = [mock_project / 'rtl' / 'counter.sv']
+
+        key1 = handler._compute_build_key(rtl, None, 'counter', 'verilator', True, sample_config)
+        key2 = handler._compute_build_key(rtl, None, 'counter', 'verilator', True, sample_config)
+
+        assert key1 is not None
+        assert key1 == key2
+
+    def test_build_key_changes_with_settings_and_sources(self, mock_project, sample_config):
+        """Test that build settings and source edits change the build key."""
+        handler = CompileHandler()
+        rtl_file = mock_project / 'rtl' / 'counter.sv'
+        key = handler._compute_build_key([rtl_file], None, 'counter', 'verilator', True, sample_config)
+
+        assert handler._compute_build_key([rtl_file], None, 'counter', 'verilator', False, sample_config) != key
+        assert handler._compute_build_key([rtl_file], None, 'other', 'verilator', True, sample_config) != key
+
+        rtl_file.write_text(rtl_file.read_text() + "\n// edited\n")
+        assert handler._compute_build_key([rtl_file], None, 'counter', 'verilator', True, sample_config) != key
+
+    def test_build_key_tracks_headers_testbenches_and_tool(self, mock_project, sample_config):
+        """Test that included headers, every testbench file and the tool identity change the build key."""
+        handler = CompileHandler()
+        rtl = [mock_project / 'rtl' / 'counter.sv']
+        include_dir = mock_project / 'include'
+        include_dir.mkdir()
+        (include_dir / 'defs.svh').write_text("`define WIDTH 4\n")
+        header = mock_project / 'rtl' / 'params.vh'
+        header.write_text("localparam DEPTH = 2;\n")
+        tbs = [mock_project / 'tb' / 'sv' / 'counter_tb.sv', mock_project / 'tb' / 'sv' / 'other_tb.sv']
+        tbs[1].write_text("module other_tb; endmodule\n")
+        config = dict(sample_config, include_paths=[str(include_dir)])
+
+        def key(tb_type='sv'):
+            return handler._compute_build_key(rtl, tbs, 'counter', 'verilator', True, config, tb_type)
+
+        base = key()
+        (include_dir / 'defs.svh').write_text("`define WIDTH 8\n")
+        assert key() != base
+
+        base = key()
+        header.write_text("localparam DEPTH = 16;\n")
+        assert key() != base
+
+        base = key()
+        tbs[1].write_text("module other_tb; initial $finish; endmodule\n")
+        assert key() != base
+
+        base = key()
+        assert key(tb_type='cocotb') != base
+        with patch.object(CompileHandler, '_tool_identity', return_value=('/opt/verilator', 'Verilator 5.0')):
+            assert key() != base
+
+    def test_manifest_ignored_when_outputs_deleted(self, temp_dir):
+        """Test that a surviving manifest is not trusted once the build outputs are gone."""
+        handler = CompileHandler()
+        (temp_dir / 'Vcounter').write_text('binary')
+        manifest = temp_dir / '.simtool_manifest.json'
+        handler._write_build_key(manifest, 'abc')
+        assert handler._read_build_key(manifest) == 'abc'
+
+        (temp_dir / 'Vcounter').unlink()
+        assert handler._read_build_key(manifest) is None
+
+    def test_build_key_missing_source(self, temp_dir, sample_config):
+        """Test that a missing source disables the up-to-date check."""
+        handler = CompileHandler()
+        key = handler._compute_build_key([temp_dir / 'missing.sv'], None, 'top', 'verilator',
+                                         True, sample_config)
+        assert key is None
+
+    def test_compile_skipped_when_up_to_date(self, mock_project):
+        """Test that a second compile with unchanged inputs skips the simulator."""
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(mock_project)
+            sim = Mock()
+            sim.compile.return_value = True
+            handler = CompileHandler()
+
+            with patch.object(CompileHandler, '_create_simulator', return_value=sim):
+                assert handler.compile_rtl([], 'counter') is True
+                assert handler.compile_rtl([], 'counter') is True
+
+            assert sim.compile.call_count == 1
+        finally:
+            os.chdir(original_cwd)
+
+    def test_user_files_classified_in_pool_only_for_larger_sets(self, mock_project):
+        """Test that a few user files are classified inline and larger sets through the pool."""
+        import concurrent.futures
+        from concurrent.futures import ThreadPoolExecutor
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(mock_project)
+            sim = Mock()
+            sim.compile.return_value = True
+            files = ['rtl/counter.sv', 'tb/sv/counter_tb.sv']
+
+            with patch.object(CompileHandler, '_create_simulator', return_value=sim), \
+                    patch.object(concurrent.futures, 'ThreadPoolExecutor', wraps=ThreadPoolExecutor) as pool:
+                assert CompileHandler().compile_rtl(files, 'counter')
+                pool.assert_not_called()
+
+                for i in range(2):
+                    (mock_project / 'rtl' / f'extra{i}.sv').write_text(f"module extra{i}; endmodule\n")
+                files += ['rtl/extra0.sv', 'rtl/extra1.sv']
+                assert CompileHandler().compile_rtl(files, 'counter')
+                pool.assert_called_once()
+
+            rtl_files = sim.compile.call_args[0][0]
+            assert [f.name for f in rtl_files] == ['counter.sv', 'extra0.sv', 'extra1.sv']
+        finally:
+            os.chdir(original_cwd)
+
+    def test_compile_many_builds_each_top_in_own_subdir(self, mock_project):
+        """Test that compile_many builds into a per-top build subdirectory."""
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(mock_project)
+            sim = Mock()
+            sim.compile.return_value = True
+
+            with patch.object(CompileHandler, '_create_simulator', return_value=sim) as create_sim:
+                results = CompileHandler().compile_many([([], 'counter')])
+
+            assert results == [True]
+            project = create_sim.call_args[0][1]
+            assert project.build_dir == Path('work') / 'counter'
+        finally:
+            os.chdir(original_cwd)
+
+    def test_compile_many_compiles_in_worker_processes(self, mock_project, monkeypatch):
+        """Test that compile_many runs each compile in a worker process (against a stub verilator)."""
+        from src.core.plugin_system import get_plugin_registry
+
+        # Stand-in verilator on PATH; PATH reaches the workers whatever the start method
+        bin_dir = mock_project / 'bin'
+        bin_dir.mkdir()
+        stub = bin_dir / 'verilator'
+        stub.write_text(_VERILATOR_STUB)
+        stub.chmod(0o755)
+        monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+        registry = get_plugin_registry()
+        registry.invalidate_availability()
+
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(mock_project)
+            results = CompileHandler().compile_many(
+                [(['rtl/counter.sv'], 'counter'), (['rtl/counter.sv'], 'alu')], waves=False)
+
+            assert results == [True, True]
+            for top in ('counter', 'alu'):
+                build_dir = mock_project / 'work' / top
+                assert (build_dir / f'V{top}').exists()
+                assert (build_dir / DefaultPaths.BUILD_MANIFEST).exists()
+                # The stub records the process that ran it: a pool worker, not this one
+                assert int((build_dir / 'compiled_by').read_text()) != os.getpid()
+        finally:
+            os.chdir(original_cwd)
+            registry.invalidate_availability()
+
+    def test_single_top_compile_supersedes_per_top_build(self, mock_project):
+        """Test that sim follows a single-top rebuild instead of an older compile_many build."""
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(mock_project)
+            sim = Mock()
+            sim.compile.return_value = True
+
+            with patch.object(CompileHandler, '_create_simulator', return_value=sim):
+                # vlog --top counter --top alu
+                for top in ('counter', 'alu'):
+                    (mock_project / 'work' / top).mkdir(parents=True)
+                    assert CompileHandler().compile_rtl([], top, build_subdir=top)
+                project = _get_project()
+                assert _project_for_top(project, 'counter').build_dir == Path('work') / 'counter'
+
+                # vlog --top counter
+                assert CompileHandler().compile_rtl([], 'counter')
+
+            assert _project_for_top(project, 'counter').build_dir == Path('work')
+            assert _project_for_top(project, 'alu').build_dir == Path('work') / 'alu'
+        finally:
+            os.chdir(original_cwd)
+
+    def test_sim_and_clean_resolve_per_top_build_dir(self, mock_project):
+        """Test that simulation and cleanup use the per-top build directories of compile_many."""
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(mock_project)
+            sim = Mock()
+            sim.compile.return_value = True
+            sim.simulate.return_value = True
+            sim.clean.return_value = True
+
+            (mock_project / 'work' / 'counter').mkdir(parents=True)
+            with patch.object(CompileHandler, '_create_simulator', return_value=sim):
+                CompileHandler().compile_many([([], 'counter')])
+
+            project = _get_project()
+            assert _project_for_top(project, 'counter').build_dir == Path('work') / 'counter'
+            assert _project_for_top(project, 'alu').build_dir == Path('work')
+
+            with patch.object(CleanupHandler, '_create_simulator', return_value=sim) as create_sim:
+                assert CleanupHandler().clean_artifacts()
+
+            cleaned = [call[0][1].build_dir for call in create_sim.call_args_list]
+            assert Path('work') / 'counter' in cleaned
+            assert Path('work') in cleaned
+        finally:
+            os.chdir(original_cwd)
+
+
+
+class TestProjectCache:
+    """Test cases for the cached project factory."""
+
+    def test_project_reused_until_config_changes(self, mock_project):
+        """Test that the project is reused until simtool.cfg is modified."""
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(mock_project)
+            project = _get_project()
+            assert _get_project() is project
+
+            config_file = mock_project / 'simtool.cfg'
+            config_file.write_text(config_file.read_text() + "\n# edited\n")
+            assert _get_project() is not project
+        finally:
+            os.chdir(original_cwd)
+
+
+class TestVerilatorVersion:
+    """Test cases for the memoized Verilator version probe."""
+
+    def test_failed_probe_is_not_cached(self):
+        """Test that a failed probe is retried while a successful one is reused."""
+        from src.cli_commands import commands
+        import subprocess
+
+        commands._probe_verilator_version.cache_clear()
+        ok = Mock(returncode=0, stdout=b'Verilator 5.020 2024-01-01\n')
+        with patch.object(subprocess, 'run', side_effect=[subprocess.TimeoutExpired('verilator', 5), ok]) as run:
+            assert commands._verilator_version('/opt/verilator') is None
+            assert commands._verilator_version('/opt/verilator') == 'Verilator 5.020 2024-01-01'
+            assert commands._verilator_version('/opt/verilator') == 'Verilator 5.020 2024-01-01'
+
+        assert run.call_count == 2
+        commands._probe_verilator_version.cache_clear()
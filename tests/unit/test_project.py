@@ -4,7 +4,9 @@ Unit tests for SimTool project management.
 
 import pytest
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 from src.core.project import Project
 
 
@@ -84,6 +86,44 @@ class TestProject:
         finally:
             os.chdir(original_cwd)
     
+    def test_find_testbenches_matches_detection(self, mock_project):
+        """Test that find_testbenches reports the same type as detect_testbench_type."""
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(mock_project)
+            
+            project = Project()
+            tb_files, tb_type = project.find_testbenches('auto')
+            
+            assert tb_files == project.get_tb_files('auto')
+            assert tb_type == project.detect_testbench_type(tb_files) == 'sv'
+        finally:
+            os.chdir(original_cwd)
+    
+    def test_find_testbenches_uses_pool_only_for_larger_sets(self, mock_project):
+        """Test that a few candidates are classified inline and larger sets through the pool."""
+        from src.core import project as project_module
+        original_cwd = Path.cwd()
+        try:
+            import os
+            os.chdir(mock_project)
+            project = Project()
+            
+            with patch.object(project_module, 'ThreadPoolExecutor', wraps=ThreadPoolExecutor) as pool:
+                tb_files, _ = project.find_testbenches('auto')
+            assert [f.name for f in tb_files] == ['counter_tb.sv']
+            pool.assert_not_called()
+            
+            for i in range(4):
+                (mock_project / 'tb' / 'sv' / f'extra{i}_tb.sv').write_text("module tb; initial $finish; endmodule\n")
+            with patch.object(project_module, 'ThreadPoolExecutor', wraps=ThreadPoolExecutor) as pool:
+                tb_files, _ = project.find_testbenches('auto')
+            assert len(tb_files) == 5
+            pool.assert_called_once()
+        finally:
+            os.chdir(original_cwd)
+    
     def test_is_sv_testbench_detection(self, temp_dir):
         """Test SystemVerilog testbench detection logic."""
         # Create test files
@@ -96,4 +136,31 @@ class TestProject:
         project = Project.__new__(Project)  # Create without calling __init__
         
         assert project._is_sv_testbench(valid_tb) is True
-        assert project._is_sv_testbench(invalid_tb) is False
\ No newline at end of file
+        assert project._is_sv_testbench(invalid_tb) is False
+    
+    def test_testbench_scan_tracks_file_edits(self, temp_dir):
+        """Test that cached testbench detection is refreshed when a file changes."""
+        tb_file = temp_dir / 'check.py'
+        tb_file.write_text('print("hello")\n')
+        
+        project = Project.__new__(Project)
+        assert project._is_cocotb_testbench(tb_file) is False
+        
+        tb_file.write_text('import cocotb\n\n@cocotb.test()\nasync def t(dut): pass\n')
+        assert project._is_cocotb_testbench(tb_file) is True
+
+    def test_testbench_scan_cache_is_bounded(self, temp_dir, monkeypatch):
+        """Test that the testbench scan cache evicts the least recently used entries."""
+        from src.core import project as project_module
+        monkeypatch.setattr(project_module, '_TB_SCAN_CACHE_SIZE', 2)
+        project_module._TB_SCAN_CACHE.clear()
+        
+        files = []
+        for name in ('a_tb.sv', 'b_tb.sv', 'c_tb.sv'):
+            tb_file = temp_dir / name
+            tb_file.write_text("module tb; initial $finish; endmodule\n")
+            files.append(tb_file)
+            project_module._scan_testbench_content(tb_file)
+        
+        assert list(project_module._TB_SCAN_CACHE) == [str(f) for f in files[1:]]
+        project_module._TB_SCAN_CACHE.clear()
@@ -0,0 +1,131 @@
+"""
+Unit tests for SimTool configuration validation.
+"""
+
+import pytest
+import yaml
+from unittest.mock import patch
+from src.core import validation
+from src.core.validation import ConfigValidator, ConfigValidationError, create_default_config
+
+
+class TestConfigValidator:
+    """Test cases for ConfigValidator class."""
+
+    def test_default_config_is_valid(self):
+        """Test that the default configuration passes validation."""
+        ConfigValidator.validate_config(create_default_config())
+
+    def test_collects_one_error_per_field(self):
+        """Test that every failing field is reported with its message."""
+        config = create_default_config()
+        config['default_simulator'] = 'unknown'
+        config['rtl_paths'] = []
+        config['default_waves'] = 'yes'
+        del config['build_dir']
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            ConfigValidator.validate_config(config)
+
+        message = str(exc_info.value)
+        assert "Field 'default_simulator' must be one of [verilator, icarus, questa, xcelium], got 'unknown'" in message
+        assert "Field 'default_waves' must be of type bool, got str" in message
+        assert "Field 'rtl_paths' must have at least 1 items, got 0" in message
+        assert "Required field 'build_dir' is missing" in message
+
+    def test_custom_validator_failure(self, temp_dir):
+        """Test that tool path validators reject missing paths."""
+        config = create_default_config()
+        config['gtkwave_path'] = str(temp_dir / 'missing-gtkwave')
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            ConfigValidator.validate_config(config)
+
+        assert "Field 'gtkwave_path' validation error" in str(exc_info.value)
+
+    def test_yaml_file_result_is_memoized(self, temp_dir):
+        """Test that an unchanged config file is served from the cache as a fresh copy."""
+        config_file = temp_dir / 'simtool.cfg'
+        config_file.write_text(yaml.dump(create_default_config()))
+
+        first = ConfigValidator.validate_yaml_file(config_file)
+        with patch.object(ConfigValidator, '_parse_and_validate') as parse:
+            second = ConfigValidator.validate_yaml_file(config_file)
+
+        parse.assert_not_called()
+        assert second == first
+        assert second is not first
+
+    def test_yaml_file_loaded_from_json_sidecar(self, temp_dir, user_cache_dir):
+        """Test that a new process-level cache falls back to the JSON cache instead of YAML."""
+        config_file = temp_dir / 'simtool.cfg'
+        config_file.write_text(yaml.dump(create_default_config()))
+
+        config = ConfigValidator.validate_yaml_file(config_file)
+        assert list(temp_dir.iterdir()) == [config_file]
+        assert list((user_cache_dir / 'simtool').glob('config-*.cache.json'))
+
+        validation._YAML_CACHE.clear()
+        with patch.object(validation.yaml, 'load') as load:
+            assert ConfigValidator.validate_yaml_file(config_file) == config
+        load.assert_not_called()
+
+    def test_json_sidecar_hit_is_still_validated(self, temp_dir):
+        """Test that a cached config is re-checked against tool paths that have since disappeared."""
+        gtkwave = temp_dir / 'gtkwave'
+        gtkwave.write_text('')
+        config_file = temp_dir / 'simtool.cfg'
+        config_file.write_text(yaml.dump(dict(create_default_config(), gtkwave_path=str(gtkwave))))
+        ConfigValidator.validate_yaml_file(config_file)
+
+        gtkwave.unlink()
+        validation._YAML_CACHE.clear()
+        validation._path_exists.cache_clear()
+        with pytest.raises(ConfigValidationError, match="gtkwave_path"):
+            ConfigValidator.validate_yaml_file(config_file)
+
+    def test_json_sidecar_ignored_when_rules_change(self, temp_dir):
+        """Test that a cached config written under different validation rules is not reused."""
+        config_file = temp_dir / 'simtool.cfg'
+        config_file.write_text(yaml.dump(create_default_config()))
+        ConfigValidator.validate_yaml_file(config_file)
+
+        validation._YAML_CACHE.clear()
+        with patch.object(ConfigValidator, '_rules_version', return_value='other'):
+            with patch.object(ConfigValidator, '_parse_and_validate',
+                              wraps=ConfigValidator._parse_and_validate) as parse:
+                ConfigValidator.validate_yaml_file(config_file)
+        parse.assert_called_once()
+
+    def test_default_config_trusted_until_modified(self):
+        """Test that validation skips an untouched default config but not a modified one."""
+        config = create_default_config()
+        with patch.object(ConfigValidator, '_get_compiled_checks') as checks:
+            ConfigValidator.validate_config(config)
+        checks.assert_not_called()
+
+        config['default_simulator'] = 'unknown'
+        with pytest.raises(ConfigValidationError):
+            ConfigValidator.validate_config(config)
+
+    def test_yaml_file_result_not_revalidated(self, temp_dir):
+        """Test that re-validating the dict returned by validate_yaml_file is a no-op."""
+        config_file = temp_dir / 'simtool.cfg'
+        config_file.write_text(yaml.dump(create_default_config()))
+
+        config = ConfigValidator.validate_yaml_file(config_file)
+        with patch.object(ConfigValidator, '_get_compiled_checks') as checks:
+            ConfigValidator.validate_config(config)
+        checks.assert_not_called()
+
+    def test_validate_configs_reports_per_config(self):
+        """Test that batch validation returns the errors of each config separately."""
+        good = create_default_config()
+        bad = dict(create_default_config(), default_waves='yes')
+        del bad['build_dir']
+
+        results = ConfigValidator.validate_configs([good, bad, good])
+
+        assert results[0] == [] and results[2] == []
+        assert results[1] == ["Field 'default_waves' must be of type bool, got str",
+                              "Required field 'build_dir' is missing"]